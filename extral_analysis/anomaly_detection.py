@@ -4,39 +4,289 @@ ICLR 异常检测模块
 检测异常评审行为和数据质量问题
 """
 
+import heapq
 import json
+import multiprocessing
+import pickle
 import numpy as np
 import pandas as pd
-from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from hashlib import blake2b
+from itertools import chain
 import os
 import statistics
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
-from scipy.stats import shapiro, skew, kurtosis
-from scipy.stats import zscore
+from scipy.stats import shapiro, normaltest
 import warnings
 warnings.filterwarnings('ignore')
 
-# 设置中文字体和样式
-plt.rcParams['font.family'] = ['Arial', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson 为可选依赖，缺失时整体解析
+    ijson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 为可选依赖，缺失时使用 NumPy 实现
+    njit = None
+
+# 评审正文的各个部分
+CONTENT_SECTIONS = ('summary', 'strengths', 'weaknesses', 'questions')
+
+# 各异常类别在检测阶段只保留最严重的 K 条（堆选择），下游报告和图表只需切片这些短列表
+TOP_K_BY_SEVERITY = 20
+TOP_K_BY_REVIEW_COUNT = 15
+TOP_K_CRITICAL = 5
+
+# 图表输出分辨率
+DEFAULT_PLOT_DPI = 150
+HIGH_PLOT_DPI = 300
+
+# 各检测步骤：(检测方法, 写入 anomaly_results 的键)，彼此独立，可并行执行
+DETECTION_STEPS = (
+    ('detect_reviewer_anomalies', 'reviewer_anomalies'),  # 1. 检测审稿人异常行为
+    ('detect_submission_anomalies', 'submission_anomalies'),  # 2. 检测异常submission
+    ('detect_rating_anomalies', 'rating_anomalies'),  # 3. 检测评分异常模式
+    ('detect_content_anomalies', 'content_anomalies'),  # 4. 检测内容异常
+    ('detect_data_quality_issues', 'data_quality_issues')  # 5. 检测数据质量问题
+)
+
+# fork 出的子进程通过该全局变量共享（写时复制）已加载的检测器，无需序列化大数据
+_FORKED_DETECTOR = None
+
+# 超过该大小的 JSON 文件在安装了 ijson 时改为流式解析，以降低峰值内存
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+
+def load_json_cached(path, stream_key=None, streaming=None):
+    """加载 JSON 文件；解析结果以 pickle 缓存在同目录，JSON 未更新时直接读取缓存
+    
+    指定 stream_key 时，大文件按该顶层键逐项流式解析（需要 ijson），
+    不必同时持有整个文件内容和解码缓冲区。streaming 为 True/False 时
+    强制开启/关闭流式解析，为 None 时按文件大小决定。
+    """
+    cache_path = path + '.pkl'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    
+    if streaming is None:
+        streaming = os.path.getsize(path) >= STREAM_THRESHOLD_BYTES
+    if stream_key and streaming and ijson is not None:
+        with open(path, 'rb') as f:
+            data = {stream_key: dict(ijson.kvitems(f, stream_key, use_float=True))}
+    elif orjson is not None:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    
+    # 缓存写入失败（如只读目录）不影响分析
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def dump_json(data, path, indent=True):
+    """写出 JSON 文件；安装了 orjson 时直接序列化为 UTF-8 字节（支持 NumPy 标量和非字符串键）"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2 if indent else None)
+
+
+def content_digest(*sections):
+    """逐段喂入 blake2b 得到内容摘要，避免拼接大字符串"""
+    h = blake2b(digest_size=16)
+    for section in sections:
+        h.update(section.encode('utf-8'))
+        h.update(b'\x00')
+    return h.digest()
+
+
+def pct_dict(counts, total):
+    """把 {字段: 计数} 转为 {字段: {'count', 'percentage'}}；total 为 0 时百分比为 0"""
+    percentages = np.fromiter(counts.values(), dtype=float, count=len(counts)) / (total or 1) * 100
+    return {
+        field: {'count': count, 'percentage': round(float(percentage), 1)}
+        for (field, count), percentage in zip(counts.items(), percentages)
+    }
+
+
+def is_known(value):
+    """字段有值且不是 'Unknown'"""
+    return bool(value) and value != 'Unknown'
+
+
+def as_python_number(value):
+    """把 NumPy/pandas 数值转为 Python 数值，整数值的浮点数还原为 int（用于 JSON 输出）"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def welford_update(state, counts, means, m2s):
+    """按 Welford/Chan 合并公式，把若干分块的 (count, mean, M2) 并入累计状态 (n, mean, M2)"""
+    counts = np.asarray(counts, dtype=float)
+    valid = counts > 0
+    if not valid.any():
+        return state
+    counts = counts[valid]
+    means = np.asarray(means, dtype=float)[valid]
+    m2s = np.asarray(m2s, dtype=float)[valid]
+    
+    # 先合并本批分块，再与已有状态合并
+    n_b = counts.sum()
+    mean_b = (counts * means).sum() / n_b
+    m2_b = m2s.sum() + (counts * (means - mean_b) ** 2).sum()
+    
+    n_a, mean_a, m2_a = state
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n
+
+
+def group_moments(codes, values, n_groups):
+    """按整数分组编码一次性计算每组的 (count, mean, M2)，忽略 NaN"""
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    counts = np.bincount(codes, weights=valid.astype(float), minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.bincount(codes, weights=x, minlength=n_groups) / counts
+    deviations = np.where(valid, x - means[codes], 0.0)
+    m2s = np.bincount(codes, weights=deviations * deviations, minlength=n_groups)
+    return counts, means, m2s
+
+
+def standardized_moments(values):
+    """一次性由中心矩计算均值、标准差、偏度和（Fisher）峰度，与 scipy 的有偏估计一致"""
+    mean = values.mean()
+    deviations = values - mean
+    squared = deviations * deviations
+    m2 = squared.mean()
+    m3 = (squared * deviations).mean()
+    m4 = (squared * squared).mean()
+    if m2 == 0:
+        return mean, 0.0, np.nan, np.nan
+    return mean, np.sqrt(m2), m3 / m2 ** 1.5, m4 / m2 ** 2 - 3
+
+
+def welford_finalize(state):
+    """由累计状态得到均值和总体标准差 (ddof=0)"""
+    n, mean, m2 = state
+    if n == 0:
+        return np.nan, np.nan
+    return mean, np.sqrt(m2 / n)
+
+
+def _completeness_buckets_numpy(present):
+    """按行统计存在的字段数，返回 (完整, 部分完整, 不完整) 的评审数"""
+    max_score = present.shape[1]
+    scores = present.sum(axis=1, dtype=np.int16)
+    complete = int(np.count_nonzero(scores == max_score))
+    partial = int(np.count_nonzero((scores < max_score) & (scores >= max_score * 0.7)))
+    return complete, partial, len(scores) - complete - partial
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _completeness_buckets_numba(present):
+        n, max_score = present.shape
+        complete = 0
+        partial = 0
+        incomplete = 0
+        for i in prange(n):
+            score = 0
+            for j in range(max_score):
+                score += present[i, j]
+            if score == max_score:
+                complete += 1
+            elif score >= max_score * 0.7:
+                partial += 1
+            else:
+                incomplete += 1
+        return complete, partial, incomplete
+
+
+def completeness_buckets(present):
+    """完整性分桶；present 为 (评审数, 字段数) 的布尔矩阵，安装了 numba 时使用编译内核"""
+    if njit is None:
+        return _completeness_buckets_numpy(present)
+    complete, partial, incomplete = _completeness_buckets_numba(present.view(np.uint8))
+    return int(complete), int(partial), int(incomplete)
+
+
+@dataclass(frozen=True)
+class GlobalStats:
+    """检测完成后的全局统计快照，供图表和汇总读取"""
+    __slots__ = ('total_reviewers', 'total_submissions', 'total_ratings', 'global_rating_mean', 'global_text_mean')
+    
+    total_reviewers: int
+    total_submissions: int
+    total_ratings: int
+    global_rating_mean: float
+    global_text_mean: float
+    
+    @classmethod
+    def from_results(cls, anomaly_results):
+        reviewer_stats = anomaly_results['reviewer_anomalies']['global_statistics']
+        return cls(
+            total_reviewers=reviewer_stats['total_reviewers'],
+            total_submissions=anomaly_results['submission_anomalies']['global_statistics']['total_submissions'],
+            total_ratings=anomaly_results['rating_anomalies']['total_ratings_analyzed'],
+            global_rating_mean=reviewer_stats['global_rating_mean'],
+            global_text_mean=reviewer_stats['global_text_mean']
+        )
+
+
+def _run_detection_step(step):
+    """在子进程中运行一个检测步骤，返回其结果"""
+    method_name, result_key = step
+    getattr(_FORKED_DETECTOR, method_name)()
+    return _FORKED_DETECTOR.anomaly_results[result_key]
+
 
 class AnomalyDetector:
-    def __init__(self, reviews_data_path, people_data_path, institutions_data_path):
-        """初始化异常检测器"""
+    def __init__(self, reviews_data_path, people_data_path, institutions_data_path,
+                 high_dpi=False, pretty_json=True, enable_plots=True, streaming=None):
+        """初始化异常检测器
+        
+        streaming 控制评审/人员 JSON 是否用 ijson 流式解析（None 表示按文件大小自动决定）；
+        enable_plots 为 False 时跳过可视化，只输出 JSON 结果；
+        high_dpi 为 True 时以 300 dpi 输出图表（默认 150 dpi）；
+        pretty_json 为 False 时结果 JSON 不缩进，文件更小、写出更快。
+        """
         print("🔍 启动异常检测模块...")
         
-        # 加载数据
-        with open(reviews_data_path, 'r', encoding='utf-8') as f:
-            self.reviews_data = json.load(f)
-            
-        with open(people_data_path, 'r', encoding='utf-8') as f:
-            self.people_data = json.load(f)
-            
-        with open(institutions_data_path, 'r', encoding='utf-8') as f:
-            self.institutions_data = json.load(f)
+        self.plot_dpi = HIGH_PLOT_DPI if high_dpi else DEFAULT_PLOT_DPI
+        self.pretty_json = pretty_json
+        self.enable_plots = enable_plots
+        
+        # 并发加载数据（带解析缓存）
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.reviews_data, self.people_data, self.institutions_data = executor.map(
+                load_json_cached,
+                [reviews_data_path, people_data_path, institutions_data_path],
+                ['reviews', 'people', None],
+                [streaming] * 3
+            )
         
         # 初始化异常检测结果
         self.anomaly_results = {
@@ -47,64 +297,153 @@ class AnomalyDetector:
             'data_quality_issues': {},
             'summary_statistics': {}
         }
+        self._global_stats = None  # 检测完成后填充的 GlobalStats
+        
+        # 展平评审数据，供各检测器复用（_reviews_flat 与 _reviews_df 的行一一对应）
+        self._reviews_flat = list(chain.from_iterable(
+            submission_data['reviews'] for submission_data in self.reviews_data['reviews'].values()
+        ))
+        self._reviews_df = self._build_reviews_frame()
+        
+        # 各检测器共用的数值列（float64）和审稿人掩码，只转换一次
+        self._ratings = self._reviews_df['rating'].to_numpy(dtype=np.float64)
+        self._confidences = self._reviews_df['confidence'].to_numpy(dtype=np.float64)
+        # 审稿人掩码按原始值的真值判断（与原先的 `if not review.get('reviewer_id')` 一致）；
+        # 不经过 DataFrame 列，避免缺失值被转成真值为 True 的 NaN
+        self._has_reviewer_id = np.fromiter(
+            (bool(review.get('reviewer_id')) for review in self._reviews_flat),
+            dtype=bool, count=len(self._reviews_flat))
         
         print("✅ 数据加载完成")
     
+    def _build_reviews_frame(self):
+        """将评审数据展平为每条评审一行的 DataFrame，并一次性预计算各部分文本长度"""
+        records = []
+        # 循环执行 N_reviews 次，把方法查找提到循环外
+        append = records.append
+        summary, strengths, weaknesses, questions = CONTENT_SECTIONS
+        for review in self._reviews_flat:
+            get = review.get
+            content_get = (get('content') or {}).get
+            append((
+                get('reviewer_id'),
+                get('rating'),
+                get('confidence'),
+                content_get(summary),
+                content_get(strengths),
+                content_get(weaknesses),
+                content_get(questions)
+            ))
+        
+        df = pd.DataFrame.from_records(records, columns=[
+            'reviewer_id', 'rating', 'confidence', *CONTENT_SECTIONS
+        ])
+        # 审稿人 ID 保持为 object 列：字符串列会把 None 转成 NaN，且丢失非字符串 ID 的原始类型
+        df['reviewer_id'] = pd.Series([record[0] for record in records], dtype=object)
+        
+        # 论文编号和评审序号按每篇论文的评审数展开，无需在循环中逐条记录
+        submissions = self.reviews_data['reviews']
+        n_submissions = len(submissions)
+        submission_nums = np.fromiter(map(int, submissions), dtype=np.int64, count=n_submissions)
+        review_counts = np.fromiter((len(data['reviews']) for data in submissions.values()),
+                                    dtype=np.int64, count=n_submissions)
+        group_starts = np.repeat(np.cumsum(review_counts) - review_counts, review_counts)
+        df.insert(0, 'submission_num', np.repeat(submission_nums, review_counts))
+        df.insert(1, 'review_index', np.arange(len(df)) - group_starts)
+        # 数值列使用紧凑类型：评分/信心度为 float32（缺失为 NaN），长度为 int32
+        df = df.astype({
+            'submission_num': np.int32,
+            'review_index': np.int16,
+            'rating': np.float32,
+            'confidence': np.float32
+        })
+        
+        # 计算文本长度
+        for section in CONTENT_SECTIONS:
+            df[section] = df[section].fillna('')
+            df[f'{section}_len'] = df[section].str.len().astype(np.int32)
+        df['total_len'] = df[[f'{section}_len' for section in CONTENT_SECTIONS]].sum(axis=1).astype(np.int32)
+        
+        # 内容质量分数（基于长度和完整性）
+        df['content_quality'] = (
+            (df['summary_len'].to_numpy() > 50).astype(np.int8)
+            + (df['strengths_len'].to_numpy() > 30)
+            + (df['weaknesses_len'].to_numpy() > 30)
+            + (df['questions_len'].to_numpy() > 20)
+        )
+        
+        # 重复内容检测用的摘要（只检测有一定长度的内容），之后丢弃原始文本以降低内存占用
+        df['content_hash'] = [
+            content_digest(s, st, w) if total_len > 50 else None
+            for s, st, w, total_len in zip(df['summary'], df['strengths'], df['weaknesses'], df['total_len'])
+        ]
+        return df.drop(columns=list(CONTENT_SECTIONS))
+    
     def detect_reviewer_anomalies(self):
         """检测异常审稿人行为"""
         print("\n👤 检测异常审稿人行为...")
         
-        # 构建审稿人数据
-        reviewer_stats = defaultdict(lambda: {
-            'ratings': [],
-            'confidences': [],
-            'text_lengths': [],
-            'review_count': 0,
-            'submission_numbers': [],
-            'review_dates': [],
-            'content_quality': []
-        })
-        
-        # 收集审稿人数据
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            for review in submission_data['reviews']:
-                reviewer_id = review.get('reviewer_id')
-                if not reviewer_id:
-                    continue
-                
-                rating = review.get('rating')
-                confidence = review.get('confidence')
-                content = review.get('content', {})
-                
-                # 计算文本长度
-                summary_len = len(content.get('summary', '')) if content.get('summary') else 0
-                strengths_len = len(content.get('strengths', '')) if content.get('strengths') else 0
-                weaknesses_len = len(content.get('weaknesses', '')) if content.get('weaknesses') else 0
-                questions_len = len(content.get('questions', '')) if content.get('questions') else 0
-                total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                
-                # 内容质量分数（基于长度和完整性）
-                content_quality = 0
-                if summary_len > 50:
-                    content_quality += 1
-                if strengths_len > 30:
-                    content_quality += 1
-                if weaknesses_len > 30:
-                    content_quality += 1
-                if questions_len > 20:
-                    content_quality += 1
-                
-                stats_data = reviewer_stats[reviewer_id]
-                if rating is not None:
-                    stats_data['ratings'].append(rating)
-                if confidence is not None:
-                    stats_data['confidences'].append(confidence)
-                stats_data['text_lengths'].append(total_len)
-                stats_data['review_count'] += 1
-                stats_data['submission_numbers'].append(int(submission_num))
-                stats_data['content_quality'].append(content_quality)
-        
-        print(f"📊 分析了 {len(reviewer_stats)} 个审稿人")
+        # 构建审稿人数据（跳过缺失 reviewer_id 的评审）
+        has_reviewer_id = self._has_reviewer_id
+        df = self._reviews_df[has_reviewer_id]
+        
+        # 审稿人 -> 整数编码，按编码聚合连续数组（SoA）
+        codes, reviewer_ids = pd.factorize(df['reviewer_id'], sort=False)
+        # factorize 把缺失值编码为 -1，这些评审不属于任何审稿人（bincount 也不接受负编码）
+        assigned = codes >= 0
+        if not assigned.all():
+            codes = codes[assigned]
+            df = df[assigned]
+            has_reviewer_id = has_reviewer_id.copy()
+            has_reviewer_id[has_reviewer_id] = assigned
+        n_reviewers = len(reviewer_ids)
+        ratings = self._ratings[has_reviewer_id]
+        confidences = self._confidences[has_reviewer_id]
+        text_lengths = df['total_len'].to_numpy(dtype=float)
+        rating_count, avg_rating, rating_m2 = group_moments(codes, ratings, n_reviewers)
+        confidence_count, avg_confidence, confidence_m2 = group_moments(codes, confidences, n_reviewers)
+        review_count, avg_text_length, text_m2 = group_moments(codes, text_lengths, n_reviewers)
+        _, avg_content_quality, _ = group_moments(
+            codes, df['content_quality'].to_numpy(dtype=float), n_reviewers)
+        
+        # 计算全局统计：直接合并上面已算出的每个审稿人的 (count, mean, M2)，
+        # 不再把各审稿人的评分/信心度/长度重新拼接成大列表
+        global_rating_mean, global_rating_std = welford_finalize(
+            welford_update((0, 0.0, 0.0), rating_count, avg_rating, rating_m2))
+        global_confidence_mean, global_confidence_std = welford_finalize(
+            welford_update((0, 0.0, 0.0), confidence_count, avg_confidence, confidence_m2))
+        global_text_mean, global_text_std = welford_finalize(
+            welford_update((0, 0.0, 0.0), review_count, avg_text_length, text_m2))
+        
+        # 只分析至少3次评审的审稿人：先筛选，后续的标准差、最值等计算只针对这些审稿人
+        eligible = review_count >= 3
+        kept = np.flatnonzero(eligible)
+        
+        # 评分最值：只取合格审稿人的评审行，按编码排序后分段归约
+        row_mask = eligible[codes]
+        kept_codes = codes[row_mask]
+        order = np.argsort(kept_codes, kind='stable')
+        group_starts = np.searchsorted(kept_codes[order], kept)
+        kept_ratings = ratings[row_mask][order]
+        min_rating = np.fmin.reduceat(kept_ratings, group_starts)
+        max_rating = np.fmax.reduceat(kept_ratings, group_starts)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rating_std = np.sqrt(rating_m2[kept] / rating_count[kept])
+        candidates = pd.DataFrame({
+            'review_count': review_count[kept].astype(int),
+            'rating_count': rating_count[kept].astype(int),
+            'avg_rating': np.nan_to_num(avg_rating[kept]),
+            'rating_std': np.nan_to_num(rating_std),
+            'min_rating': min_rating,
+            'max_rating': max_rating,
+            'confidence_count': confidence_count[kept].astype(int),
+            'avg_confidence': np.nan_to_num(avg_confidence[kept]),
+            'avg_text_length': avg_text_length[kept],
+            'avg_content_quality': avg_content_quality[kept]
+        }, index=reviewer_ids[kept])
+        
+        print(f"📊 分析了 {n_reviewers} 个审稿人")
         
         # 检测异常行为
         anomalous_reviewers = {
@@ -116,124 +455,97 @@ class AnomalyDetector:
             'outlier_reviewers': []  # 综合异常者
         }
         
-        # 计算全局统计
-        all_ratings = []
-        all_confidences = []
-        all_text_lengths = []
-        all_content_qualities = []
-        
-        for stats_data in reviewer_stats.values():
-            all_ratings.extend(stats_data['ratings'])
-            all_confidences.extend(stats_data['confidences'])
-            all_text_lengths.extend(stats_data['text_lengths'])
-            all_content_qualities.extend(stats_data['content_quality'])
-        
-        global_rating_mean = np.mean(all_ratings)
-        global_rating_std = np.std(all_ratings)
-        global_text_mean = np.mean(all_text_lengths)
-        global_text_std = np.std(all_text_lengths)
-        global_confidence_mean = np.mean(all_confidences)
-        global_confidence_std = np.std(all_confidences)
-        
-        # 分析每个审稿人
-        for reviewer_id, stats_data in reviewer_stats.items():
-            if stats_data['review_count'] < 3:  # 至少3次评审
-                continue
-            
-            # 计算个人统计
-            avg_rating = np.mean(stats_data['ratings']) if stats_data['ratings'] else 0
-            rating_std = np.std(stats_data['ratings']) if len(stats_data['ratings']) > 1 else 0
-            avg_confidence = np.mean(stats_data['confidences']) if stats_data['confidences'] else 0
-            avg_text_length = np.mean(stats_data['text_lengths'])
-            avg_content_quality = np.mean(stats_data['content_quality'])
-            
-            # 1. 极端评分检测
-            if abs(avg_rating - global_rating_mean) > 2 * global_rating_std:
-                anomalous_reviewers['extreme_raters'].append({
-                    'reviewer_id': reviewer_id,
-                    'avg_rating': round(avg_rating, 2),
-                    'global_avg': round(global_rating_mean, 2),
-                    'deviation': round(abs(avg_rating - global_rating_mean), 2),
-                    'review_count': stats_data['review_count'],
-                    'anomaly_type': 'extreme_high' if avg_rating > global_rating_mean else 'extreme_low'
-                })
-            
-            # 2. 不一致性检测
-            if rating_std > 2.5:  # 评分标准差过大
-                anomalous_reviewers['inconsistent_raters'].append({
-                    'reviewer_id': reviewer_id,
-                    'rating_std': round(rating_std, 2),
-                    'avg_rating': round(avg_rating, 2),
-                    'review_count': stats_data['review_count'],
-                    'rating_range': round(max(stats_data['ratings']) - min(stats_data['ratings']), 1)
-                })
-            
-            # 3. 低努力度检测
-            if avg_text_length < global_text_mean - 2 * global_text_std or avg_content_quality < 1.5:
-                anomalous_reviewers['low_effort_reviewers'].append({
-                    'reviewer_id': reviewer_id,
-                    'avg_text_length': round(avg_text_length, 0),
-                    'global_avg_length': round(global_text_mean, 0),
-                    'content_quality': round(avg_content_quality, 1),
-                    'review_count': stats_data['review_count']
-                })
-            
-            # 4. 过度自信检测
-            if avg_confidence > global_confidence_mean + 1.5 * global_confidence_std:
-                anomalous_reviewers['over_confident'].append({
-                    'reviewer_id': reviewer_id,
-                    'avg_confidence': round(avg_confidence, 2),
-                    'global_avg_confidence': round(global_confidence_mean, 2),
-                    'review_count': stats_data['review_count']
-                })
-            
-            # 5. 信心不足检测
-            if avg_confidence < global_confidence_mean - 1.5 * global_confidence_std:
-                anomalous_reviewers['under_confident'].append({
-                    'reviewer_id': reviewer_id,
-                    'avg_confidence': round(avg_confidence, 2),
-                    'global_avg_confidence': round(global_confidence_mean, 2),
-                    'review_count': stats_data['review_count']
-                })
-            
-            # 6. 综合异常检测（Z-score）
-            z_scores = []
-            if stats_data['ratings']:
-                z_scores.append(abs(zscore([avg_rating], ddof=0)[0]))
-            if stats_data['confidences']:
-                z_scores.append(abs(zscore([avg_confidence], ddof=0)[0]))
-            z_scores.append(abs((avg_text_length - global_text_mean) / global_text_std))
-            
-            max_z_score = max(z_scores) if z_scores else 0
-            if max_z_score > 3:  # 超过3个标准差
-                anomalous_reviewers['outlier_reviewers'].append({
-                    'reviewer_id': reviewer_id,
-                    'max_z_score': round(max_z_score, 2),
-                    'avg_rating': round(avg_rating, 2),
-                    'avg_confidence': round(avg_confidence, 2),
-                    'avg_text_length': round(avg_text_length, 0),
-                    'review_count': stats_data['review_count']
-                })
+        # 相对全局分布的标准化得分 (x - mu) / sigma，一次算出供各阈值检测复用
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z_rating = (candidates['avg_rating'] - global_rating_mean) / global_rating_std
+            z_confidence = (candidates['avg_confidence'] - global_confidence_mean) / global_confidence_std
+            z_text = (candidates['avg_text_length'] - global_text_mean) / global_text_std
+        
+        # 1. 极端评分检测
+        for r in candidates[z_rating.abs() > 2].itertuples():
+            anomalous_reviewers['extreme_raters'].append({
+                'reviewer_id': r.Index,
+                'avg_rating': round(r.avg_rating, 2),
+                'global_avg': round(global_rating_mean, 2),
+                'deviation': round(abs(r.avg_rating - global_rating_mean), 2),
+                'review_count': r.review_count,
+                'anomaly_type': 'extreme_high' if r.avg_rating > global_rating_mean else 'extreme_low'
+            })
+        
+        # 2. 不一致性检测（评分标准差过大）
+        for r in candidates[candidates['rating_std'] > 2.5].itertuples():
+            anomalous_reviewers['inconsistent_raters'].append({
+                'reviewer_id': r.Index,
+                'rating_std': round(r.rating_std, 2),
+                'avg_rating': round(r.avg_rating, 2),
+                'review_count': r.review_count,
+                'rating_range': as_python_number(round(r.max_rating - r.min_rating, 1))
+            })
+        
+        # 3. 低努力度检测
+        for r in candidates[(z_text < -2) | (candidates['avg_content_quality'] < 1.5)].itertuples():
+            anomalous_reviewers['low_effort_reviewers'].append({
+                'reviewer_id': r.Index,
+                'avg_text_length': round(r.avg_text_length, 0),
+                'global_avg_length': round(global_text_mean, 0),
+                'content_quality': round(r.avg_content_quality, 1),
+                'review_count': r.review_count
+            })
+        
+        # 4. 过度自信检测
+        for r in candidates[z_confidence > 1.5].itertuples():
+            anomalous_reviewers['over_confident'].append({
+                'reviewer_id': r.Index,
+                'avg_confidence': round(r.avg_confidence, 2),
+                'global_avg_confidence': round(global_confidence_mean, 2),
+                'review_count': r.review_count
+            })
+        
+        # 5. 信心不足检测
+        for r in candidates[z_confidence < -1.5].itertuples():
+            anomalous_reviewers['under_confident'].append({
+                'reviewer_id': r.Index,
+                'avg_confidence': round(r.avg_confidence, 2),
+                'global_avg_confidence': round(global_confidence_mean, 2),
+                'review_count': r.review_count
+            })
+        
+        # 6. 综合异常检测（取绝对值最大的 Z-score，忽略没有评分/信心度的维度）
+        z_scores = np.stack([
+            np.where(candidates['rating_count'] > 0, z_rating, np.nan),
+            np.where(candidates['confidence_count'] > 0, z_confidence, np.nan),
+            z_text
+        ])
+        with np.errstate(invalid='ignore'):
+            max_z_scores = np.nanmax(np.abs(z_scores), axis=0)
+        outliers = candidates.assign(max_z_score=max_z_scores)
+        for r in outliers[outliers['max_z_score'] > 3].itertuples():  # 超过3个标准差
+            anomalous_reviewers['outlier_reviewers'].append({
+                'reviewer_id': r.Index,
+                'max_z_score': round(r.max_z_score, 2),
+                'avg_rating': round(r.avg_rating, 2),
+                'avg_confidence': round(r.avg_confidence, 2),
+                'avg_text_length': round(r.avg_text_length, 0),
+                'review_count': r.review_count
+            })
         
         # 排序异常结果
         for anomaly_type in anomalous_reviewers:
             if anomaly_type in ['extreme_raters', 'outlier_reviewers']:
-                anomalous_reviewers[anomaly_type] = sorted(
-                    anomalous_reviewers[anomaly_type], 
-                    key=lambda x: x.get('deviation', x.get('max_z_score', 0)), 
-                    reverse=True
-                )[:20]  # Top 20
+                anomalous_reviewers[anomaly_type] = heapq.nlargest(
+                    TOP_K_BY_SEVERITY, anomalous_reviewers[anomaly_type],
+                    key=lambda x: x.get('deviation', x.get('max_z_score', 0))
+                )
             else:
-                anomalous_reviewers[anomaly_type] = sorted(
-                    anomalous_reviewers[anomaly_type], 
-                    key=lambda x: x['review_count'], 
-                    reverse=True
-                )[:15]  # Top 15
+                anomalous_reviewers[anomaly_type] = heapq.nlargest(
+                    TOP_K_BY_REVIEW_COUNT, anomalous_reviewers[anomaly_type],
+                    key=lambda x: x['review_count']
+                )
         
         self.anomaly_results['reviewer_anomalies'] = {
             'anomalous_reviewers': anomalous_reviewers,
             'global_statistics': {
-                'total_reviewers': len(reviewer_stats),
+                'total_reviewers': n_reviewers,
                 'global_rating_mean': round(global_rating_mean, 2),
                 'global_rating_std': round(global_rating_std, 2),
                 'global_confidence_mean': round(global_confidence_mean, 2),
@@ -247,46 +559,22 @@ class AnomalyDetector:
         """检测异常submission"""
         print("\n📄 检测异常submission...")
         
-        submission_stats = {}
-        
-        # 收集submission数据
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            reviews = submission_data['reviews']
-            
-            ratings = []
-            confidences = []
-            text_lengths = []
-            
-            for review in reviews:
-                rating = review.get('rating')
-                confidence = review.get('confidence')
-                content = review.get('content', {})
-                
-                if rating is not None:
-                    ratings.append(rating)
-                if confidence is not None:
-                    confidences.append(confidence)
-                
-                # 计算文本长度
-                summary_len = len(content.get('summary', '')) if content.get('summary') else 0
-                strengths_len = len(content.get('strengths', '')) if content.get('strengths') else 0
-                weaknesses_len = len(content.get('weaknesses', '')) if content.get('weaknesses') else 0
-                questions_len = len(content.get('questions', '')) if content.get('questions') else 0
-                total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                text_lengths.append(total_len)
-            
-            if ratings:
-                submission_stats[submission_num] = {
-                    'num_reviews': len(reviews),
-                    'avg_rating': np.mean(ratings),
-                    'rating_std': np.std(ratings) if len(ratings) > 1 else 0,
-                    'min_rating': min(ratings),
-                    'max_rating': max(ratings),
-                    'rating_range': max(ratings) - min(ratings),
-                    'avg_confidence': np.mean(confidences) if confidences else 0,
-                    'avg_text_length': np.mean(text_lengths),
-                    'ratings': ratings
-                }
+        # 按submission聚合（只保留至少有一个评分的submission）
+        df = self._reviews_df.assign(rating=self._ratings, confidence=self._confidences)
+        grouped = df.groupby('submission_num', sort=False)
+        submission_stats = grouped.agg(
+            num_reviews=('rating', 'size'),
+            rating_count=('rating', 'count'),
+            avg_rating=('rating', 'mean'),
+            min_rating=('rating', 'min'),
+            max_rating=('rating', 'max'),
+            avg_confidence=('confidence', 'mean'),
+            avg_text_length=('total_len', 'mean')
+        )
+        submission_stats['rating_std'] = grouped['rating'].std(ddof=0)
+        submission_stats['rating_range'] = submission_stats['max_rating'] - submission_stats['min_rating']
+        submission_stats['avg_confidence'] = submission_stats['avg_confidence'].fillna(0)
+        submission_stats = submission_stats[submission_stats['rating_count'] > 0]
         
         print(f"📊 分析了 {len(submission_stats)} 个submission")
         
@@ -299,56 +587,64 @@ class AnomalyDetector:
         }
         
         # 计算全局统计
-        all_avg_ratings = [s['avg_rating'] for s in submission_stats.values()]
-        all_rating_stds = [s['rating_std'] for s in submission_stats.values()]
-        all_text_lengths = [s['avg_text_length'] for s in submission_stats.values()]
-        
-        global_avg_rating = np.mean(all_avg_ratings)
-        global_rating_std_mean = np.mean(all_rating_stds)
-        global_text_mean = np.mean(all_text_lengths)
-        
-        # 分析每个submission
-        for submission_num, stats in submission_stats.items():
-            # 1. 争议性论文检测（评分分歧大）
-            if stats['rating_std'] > 2.0 and stats['num_reviews'] >= 3:
-                anomalous_submissions['controversial_papers'].append({
-                    'submission_num': int(submission_num),
-                    'rating_std': round(stats['rating_std'], 2),
-                    'avg_rating': round(stats['avg_rating'], 2),
-                    'rating_range': stats['rating_range'],
-                    'num_reviews': stats['num_reviews'],
-                    'ratings': stats['ratings']
-                })
-            
-            # 2. 共识异常检测（过于一致）
-            if stats['rating_std'] < 0.2 and stats['num_reviews'] >= 3:
-                anomalous_submissions['consensus_outliers'].append({
-                    'submission_num': int(submission_num),
-                    'rating_std': round(stats['rating_std'], 2),
-                    'avg_rating': round(stats['avg_rating'], 2),
-                    'num_reviews': stats['num_reviews'],
-                    'ratings': stats['ratings']
-                })
-            
-            # 3. 极端评分检测
-            if stats['avg_rating'] <= 2.5 or stats['avg_rating'] >= 8.0:
-                anomalous_submissions['extreme_rated_papers'].append({
-                    'submission_num': int(submission_num),
-                    'avg_rating': round(stats['avg_rating'], 2),
-                    'min_rating': stats['min_rating'],
-                    'max_rating': stats['max_rating'],
-                    'num_reviews': stats['num_reviews'],
-                    'extreme_type': 'very_low' if stats['avg_rating'] <= 2.5 else 'very_high'
-                })
-            
-            # 4. 低质量评审检测
-            if stats['avg_text_length'] < 500 and stats['num_reviews'] >= 2:
-                anomalous_submissions['low_quality_reviews'].append({
-                    'submission_num': int(submission_num),
-                    'avg_text_length': round(stats['avg_text_length'], 0),
-                    'avg_rating': round(stats['avg_rating'], 2),
-                    'num_reviews': stats['num_reviews']
-                })
+        global_avg_rating = submission_stats['avg_rating'].mean()
+        global_rating_std_mean = submission_stats['rating_std'].mean()
+        global_text_mean = submission_stats['avg_text_length'].mean()
+        
+        def ratings_of(submissions):
+            """取出指定submission的原始评分列表"""
+            rows = df[df['submission_num'].isin(submissions.index) & df['rating'].notna()]
+            return {
+                submission_num: [as_python_number(rating) for rating in ratings]
+                for submission_num, ratings in rows.groupby('submission_num', sort=False)['rating']
+            }
+        
+        # 1. 争议性论文检测（评分分歧大）
+        controversial = submission_stats[(submission_stats['rating_std'] > 2.0) & (submission_stats['num_reviews'] >= 3)]
+        controversial_ratings = ratings_of(controversial)
+        for s in controversial.itertuples():
+            anomalous_submissions['controversial_papers'].append({
+                'submission_num': s.Index,
+                'rating_std': round(s.rating_std, 2),
+                'avg_rating': round(s.avg_rating, 2),
+                'rating_range': as_python_number(s.rating_range),
+                'num_reviews': s.num_reviews,
+                'ratings': controversial_ratings[s.Index]
+            })
+        
+        # 2. 共识异常检测（过于一致）
+        consensus = submission_stats[(submission_stats['rating_std'] < 0.2) & (submission_stats['num_reviews'] >= 3)]
+        consensus_ratings = ratings_of(consensus)
+        for s in consensus.itertuples():
+            anomalous_submissions['consensus_outliers'].append({
+                'submission_num': s.Index,
+                'rating_std': round(s.rating_std, 2),
+                'avg_rating': round(s.avg_rating, 2),
+                'num_reviews': s.num_reviews,
+                'ratings': consensus_ratings[s.Index]
+            })
+        
+        # 3. 极端评分检测
+        extreme = submission_stats[(submission_stats['avg_rating'] <= 2.5) | (submission_stats['avg_rating'] >= 8.0)]
+        for s in extreme.itertuples():
+            anomalous_submissions['extreme_rated_papers'].append({
+                'submission_num': s.Index,
+                'avg_rating': round(s.avg_rating, 2),
+                'min_rating': as_python_number(s.min_rating),
+                'max_rating': as_python_number(s.max_rating),
+                'num_reviews': s.num_reviews,
+                'extreme_type': 'very_low' if s.avg_rating <= 2.5 else 'very_high'
+            })
+        
+        # 4. 低质量评审检测
+        low_quality = submission_stats[(submission_stats['avg_text_length'] < 500) & (submission_stats['num_reviews'] >= 2)]
+        for s in low_quality.itertuples():
+            anomalous_submissions['low_quality_reviews'].append({
+                'submission_num': s.Index,
+                'avg_text_length': round(s.avg_text_length, 0),
+                'avg_rating': round(s.avg_rating, 2),
+                'num_reviews': s.num_reviews
+            })
         
         # 排序结果
         for anomaly_type in anomalous_submissions:
@@ -361,11 +657,9 @@ class AnomalyDetector:
             else:  # low_quality_reviews
                 key_func = lambda x: -x['avg_text_length']  # 负号表示越短越异常
             
-            anomalous_submissions[anomaly_type] = sorted(
-                anomalous_submissions[anomaly_type], 
-                key=key_func, 
-                reverse=True
-            )[:20]  # Top 20
+            anomalous_submissions[anomaly_type] = heapq.nlargest(
+                TOP_K_BY_SEVERITY, anomalous_submissions[anomaly_type], key=key_func
+            )
         
         self.anomaly_results['submission_anomalies'] = {
             'anomalous_submissions': anomalous_submissions,
@@ -383,32 +677,23 @@ class AnomalyDetector:
         """检测评分异常模式"""
         print("\n📊 检测评分异常模式...")
         
-        # 收集所有评分数据
-        all_ratings = []
-        rating_patterns = defaultdict(int)
-        rating_confidence_pairs = []
-        rating_by_position = defaultdict(list)  # 按评审位置分组
-        
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            reviews = submission_data['reviews']
-            submission_ratings = []
-            
-            for i, review in enumerate(reviews):
-                rating = review.get('rating')
-                confidence = review.get('confidence')
-                
-                if rating is not None:
-                    all_ratings.append(rating)
-                    submission_ratings.append(rating)
-                    rating_patterns[rating] += 1
-                    rating_by_position[i].append(rating)
-                    
-                    if confidence is not None:
-                        rating_confidence_pairs.append((rating, confidence))
-        
-        # 分析评分分布异常
-        rating_distribution = Counter(all_ratings)
-        total_ratings = len(all_ratings)
+        # 收集所有评分数据（复用展平后的评审数据）
+        rated = self._reviews_df.assign(rating=self._ratings, confidence=self._confidences)[~np.isnan(self._ratings)]
+        ratings_array = rated['rating'].to_numpy()
+        
+        # 分析评分分布异常：常规整数评分用定长 bincount 直方图，否则回退到 np.unique
+        small_integral = (ratings_array.size > 0 and 0 <= ratings_array.min() and ratings_array.max() <= 100
+                          and np.all(ratings_array == np.floor(ratings_array)))
+        if small_integral:
+            histogram = np.bincount(ratings_array.astype(np.int64))
+            rating_values = np.flatnonzero(histogram)
+            rating_counts = histogram[rating_values]
+        else:
+            rating_values, rating_counts = np.unique(ratings_array, return_counts=True)
+        rating_distribution = {
+            as_python_number(rating): int(count) for rating, count in zip(rating_values, rating_counts)
+        }
+        total_ratings = int(ratings_array.size)
         
         anomalous_patterns = {
             'unusual_rating_frequencies': [],
@@ -419,52 +704,50 @@ class AnomalyDetector:
         
         # 1. 异常评分频率检测
         expected_freq = total_ratings / 10  # 假设评分1-10均匀分布
-        for rating, count in rating_distribution.items():
-            freq_ratio = count / expected_freq
-            if freq_ratio > 2.0 or freq_ratio < 0.3:  # 过高或过低
-                anomalous_patterns['unusual_rating_frequencies'].append({
-                    'rating': rating,
-                    'count': count,
-                    'percentage': round(count / total_ratings * 100, 1),
-                    'expected_percentage': 10.0,
-                    'frequency_ratio': round(freq_ratio, 2),
-                    'anomaly_type': 'over_frequent' if freq_ratio > 2.0 else 'under_frequent'
-                })
+        freq_ratios = rating_counts / expected_freq
+        unusual = (freq_ratios > 2.0) | (freq_ratios < 0.3)  # 过高或过低
+        for rating, count, freq_ratio in zip(rating_values[unusual], rating_counts[unusual], freq_ratios[unusual]):
+            anomalous_patterns['unusual_rating_frequencies'].append({
+                'rating': as_python_number(rating),
+                'count': int(count),
+                'percentage': round(count / total_ratings * 100, 1),
+                'expected_percentage': 10.0,
+                'frequency_ratio': round(freq_ratio, 2),
+                'anomaly_type': 'over_frequent' if freq_ratio > 2.0 else 'under_frequent'
+            })
         
         # 2. 评分-信心度不匹配检测
-        if rating_confidence_pairs:
-            # 计算每个评分的平均信心度
-            rating_to_confidence = defaultdict(list)
-            for rating, confidence in rating_confidence_pairs:
-                rating_to_confidence[rating].append(confidence)
+        # 计算每个评分的平均信心度
+        rating_to_confidence = rated[rated['confidence'].notna()].groupby('rating', sort=False)['confidence'].agg(
+            avg_confidence='mean',
+            sample_count='size'
+        )
+        for rating, row in rating_to_confidence[rating_to_confidence['sample_count'] >= 10].iterrows():  # 至少10个样本
+            # 期望：低分低信心，高分高信心
+            expected_confidence = 2.0 + (rating - 1) * 0.3  # 简化的期望模型
             
-            for rating, confidences in rating_to_confidence.items():
-                if len(confidences) >= 10:  # 至少10个样本
-                    avg_confidence = np.mean(confidences)
-                    # 期望：低分低信心，高分高信心
-                    expected_confidence = 2.0 + (rating - 1) * 0.3  # 简化的期望模型
-                    
-                    if abs(avg_confidence - expected_confidence) > 1.0:
-                        anomalous_patterns['rating_confidence_mismatches'].append({
-                            'rating': rating,
-                            'avg_confidence': round(avg_confidence, 2),
-                            'expected_confidence': round(expected_confidence, 2),
-                            'mismatch_degree': round(abs(avg_confidence - expected_confidence), 2),
-                            'sample_count': len(confidences)
-                        })
-        
-        # 3. 位置偏见检测
-        position_stats = {}
-        for position, ratings in rating_by_position.items():
-            if len(ratings) >= 50:  # 至少50个样本
-                position_stats[position] = {
-                    'avg_rating': np.mean(ratings),
-                    'count': len(ratings),
-                    'std': np.std(ratings)
-                }
+            if abs(row['avg_confidence'] - expected_confidence) > 1.0:
+                anomalous_patterns['rating_confidence_mismatches'].append({
+                    'rating': as_python_number(rating),
+                    'avg_confidence': round(row['avg_confidence'], 2),
+                    'expected_confidence': round(expected_confidence, 2),
+                    'mismatch_degree': round(abs(row['avg_confidence'] - expected_confidence), 2),
+                    'sample_count': int(row['sample_count'])
+                })
+        
+        # 3. 位置偏见检测（至少50个样本）
+        by_position = rated.groupby('review_index', sort=False)['rating']
+        position_stats = pd.DataFrame({
+            'avg_rating': by_position.mean(),
+            'count': by_position.size(),
+            'std': by_position.std(ddof=0)
+        })
+        position_stats = {
+            int(position): row for position, row in position_stats[position_stats['count'] >= 50].iterrows()
+        }
         
         if len(position_stats) >= 2:
-            global_avg = np.mean(all_ratings)
+            global_avg = ratings_array.mean()
             for position, stats in position_stats.items():
                 if abs(stats['avg_rating'] - global_avg) > 0.2:
                     anomalous_patterns['position_bias_effects'].append({
@@ -472,35 +755,35 @@ class AnomalyDetector:
                         'avg_rating': round(stats['avg_rating'], 2),
                         'global_avg': round(global_avg, 2),
                         'bias_degree': round(stats['avg_rating'] - global_avg, 2),
-                        'sample_count': stats['count']
+                        'sample_count': int(stats['count'])
                     })
         
         # 4. 分布异常检测
-        ratings_array = np.array(all_ratings)
-        
-        # 正态性检验
-        shapiro_stat, shapiro_p = shapiro(ratings_array[:5000])  # 限制样本大小
+        # 正态性检验：Shapiro-Wilk 只适用于 5000 以内的样本，更大时改用覆盖全部数据的 D'Agostino-Pearson 检验
+        if ratings_array.size > 5000:
+            normality_stat, normality_p = normaltest(ratings_array)
+        else:
+            normality_stat, normality_p = shapiro(ratings_array)
         
-        # 偏度和峰度
-        skewness_val = skew(ratings_array)
-        kurtosis_val = kurtosis(ratings_array)
+        # 均值、标准差、偏度和峰度（同一组中心矩）
+        mean_val, std_val, skewness_val, kurtosis_val = standardized_moments(ratings_array)
         
         anomalous_patterns['distribution_anomalies'] = {
             'normality_test': {
-                'statistic': round(shapiro_stat, 3),
-                'p_value': round(shapiro_p, 3),
-                'is_normal': bool(shapiro_p > 0.05)
+                'statistic': round(normality_stat, 3),
+                'p_value': round(normality_p, 3),
+                'is_normal': bool(normality_p > 0.05)
             },
             'skewness': round(skewness_val, 3),
             'kurtosis': round(kurtosis_val, 3),
-            'mean': round(np.mean(ratings_array), 2),
-            'std': round(np.std(ratings_array), 2),
+            'mean': round(mean_val, 2),
+            'std': round(std_val, 2),
             'distribution_type': self._classify_distribution(skewness_val, kurtosis_val)
         }
         
         self.anomaly_results['rating_anomalies'] = {
             'total_ratings_analyzed': total_ratings,
-            'rating_distribution': dict(rating_distribution),
+            'rating_distribution': rating_distribution,
             'anomalous_patterns': anomalous_patterns
         }
         
@@ -533,103 +816,71 @@ class AnomalyDetector:
             'duplicate_content': []
         }
         
-        all_text_lengths = []
+        df = self._reviews_df
+        all_text_lengths = df['total_len'].to_numpy(dtype=np.int32)
         section_lengths = {
-            'summary': [],
-            'strengths': [],
-            'weaknesses': [],
-            'questions': []
+            section: df[f'{section}_len'].to_numpy(dtype=np.int32)
+            for section in CONTENT_SECTIONS
         }
         
-        content_hashes = defaultdict(list)  # 用于检测重复内容
-        
-        # 收集内容数据
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            for i, review in enumerate(reviews := submission_data['reviews']):
-                content = review.get('content', {})
-                reviewer_id = review.get('reviewer_id', 'unknown')
-                
-                # 提取各部分内容
-                summary = content.get('summary', '')
-                strengths = content.get('strengths', '')
-                weaknesses = content.get('weaknesses', '')
-                questions = content.get('questions', '')
-                
-                # 计算长度
-                summary_len = len(summary) if summary else 0
-                strengths_len = len(strengths) if strengths else 0
-                weaknesses_len = len(weaknesses) if weaknesses else 0
-                questions_len = len(questions) if questions else 0
-                total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                
-                all_text_lengths.append(total_len)
-                section_lengths['summary'].append(summary_len)
-                section_lengths['strengths'].append(strengths_len)
-                section_lengths['weaknesses'].append(weaknesses_len)
-                section_lengths['questions'].append(questions_len)
-                
-                review_info = {
-                    'submission_num': int(submission_num),
-                    'reviewer_id': reviewer_id,
-                    'review_index': i
-                }
-                
-                # 1. 空内容检测
-                if total_len == 0:
-                    content_stats['empty_content'].append({
-                        **review_info,
-                        'total_length': total_len
-                    })
-                
-                # 2. 极短内容检测
-                elif total_len < 100:
-                    content_stats['extremely_short'].append({
-                        **review_info,
-                        'total_length': total_len,
-                        'summary_len': summary_len,
-                        'strengths_len': strengths_len,
-                        'weaknesses_len': weaknesses_len
-                    })
-                
-                # 3. 极长内容检测
-                elif total_len > 10000:
-                    content_stats['extremely_long'].append({
-                        **review_info,
-                        'total_length': total_len
-                    })
-                
-                # 4. 缺失重要部分检测
-                missing_sections = []
-                if summary_len == 0:
-                    missing_sections.append('summary')
-                if strengths_len == 0:
-                    missing_sections.append('strengths')
-                if weaknesses_len == 0:
-                    missing_sections.append('weaknesses')
-                
-                if len(missing_sections) >= 2:  # 缺失2个或以上重要部分
-                    content_stats['missing_sections'].append({
-                        **review_info,
-                        'missing_sections': missing_sections,
-                        'total_length': total_len
-                    })
-                
-                # 5. 重复内容检测（简化版）
-                if total_len > 50:  # 只检测有一定长度的内容
-                    content_hash = hash(summary + strengths + weaknesses)
-                    content_hashes[content_hash].append({
-                        **review_info,
-                        'total_length': total_len
-                    })
+        reviews_flat = self._reviews_flat
         
-        # 检测重复内容
-        for content_hash, reviews in content_hashes.items():
-            if len(reviews) > 1:  # 发现重复
-                content_stats['duplicate_content'].append({
-                    'duplicate_count': len(reviews),
-                    'reviews': reviews,
-                    'content_hash': str(content_hash)
-                })
+        def review_info(review):
+            # 缺少 reviewer_id 键的评审记为 'unknown'（显式为 null 的仍为 None），从原始评审中读取以区分两者
+            return {
+                'submission_num': review.submission_num,
+                'reviewer_id': reviews_flat[review.Index].get('reviewer_id', 'unknown'),
+                'review_index': review.review_index
+            }
+        
+        # 1. 空内容检测
+        for review in df[df['total_len'] == 0].itertuples():
+            content_stats['empty_content'].append({
+                **review_info(review),
+                'total_length': review.total_len
+            })
+        
+        # 2. 极短内容检测
+        for review in df[(df['total_len'] > 0) & (df['total_len'] < 100)].itertuples():
+            content_stats['extremely_short'].append({
+                **review_info(review),
+                'total_length': review.total_len,
+                'summary_len': review.summary_len,
+                'strengths_len': review.strengths_len,
+                'weaknesses_len': review.weaknesses_len
+            })
+        
+        # 3. 极长内容检测
+        for review in df[df['total_len'] > 10000].itertuples():
+            content_stats['extremely_long'].append({
+                **review_info(review),
+                'total_length': review.total_len
+            })
+        
+        # 4. 缺失重要部分检测（缺失2个或以上重要部分）
+        missing = df[['summary_len', 'strengths_len', 'weaknesses_len']] == 0
+        for review in df[missing.sum(axis=1) >= 2].itertuples():
+            content_stats['missing_sections'].append({
+                **review_info(review),
+                'missing_sections': [
+                    section for section in ('summary', 'strengths', 'weaknesses')
+                    if getattr(review, f'{section}_len') == 0
+                ],
+                'total_length': review.total_len
+            })
+        
+        # 5. 重复内容检测（简化版，摘要只为有一定长度的内容计算）
+        hashed = df[df['content_hash'].notna()]
+        duplicated = hashed[hashed.duplicated('content_hash', keep=False)]
+        for content_hash, reviews in duplicated.groupby('content_hash', sort=False):
+            content_stats['duplicate_content'].append({
+                'duplicate_count': len(reviews),
+                'reviews': [
+                    {**review_info(review), 'total_length': review.total_len}
+                    for review in reviews.itertuples()
+                ],
+                'content_hash': content_hash.hex()
+            })
         
         # 计算统计信息
         content_statistics = {
@@ -641,20 +892,21 @@ class AnomalyDetector:
         }
         
         for section, lengths in section_lengths.items():
+            zero_count = int(np.count_nonzero(lengths == 0))
             content_statistics['section_statistics'][section] = {
                 'avg_length': round(np.mean(lengths), 0),
                 'median_length': round(np.median(lengths), 0),
-                'zero_count': lengths.count(0),
-                'zero_percentage': round(lengths.count(0) / len(lengths) * 100, 1)
+                'zero_count': zero_count,
+                'zero_percentage': round(zero_count / len(lengths) * 100, 1)
             }
         
         # 排序异常结果
         for anomaly_type in ['extremely_short', 'extremely_long', 'missing_sections']:
             if anomaly_type in content_stats:
-                content_stats[anomaly_type] = sorted(
-                    content_stats[anomaly_type],
+                content_stats[anomaly_type] = heapq.nsmallest(
+                    TOP_K_BY_SEVERITY, content_stats[anomaly_type],
                     key=lambda x: x['total_length']
-                )[:20]  # Top 20
+                )
         
         self.anomaly_results['content_anomalies'] = {
             'anomalous_content': content_stats,
@@ -676,15 +928,27 @@ class AnomalyDetector:
             'completeness_analysis': {}
         }
         
-        # 统计缺失数据
+        df = self._reviews_df
+        total_reviews = len(df)
+        
+        # 各字段是否存在（缺失统计与完整性分析共用同一组掩码）
+        present = {
+            'rating': ~np.isnan(self._ratings),
+            'confidence': ~np.isnan(self._confidences),
+            'reviewer_id': self._has_reviewer_id,
+            **{
+                f'content_{section}': df[f'{section}_len'].to_numpy() > 0
+                for section in CONTENT_SECTIONS
+            }
+        }
+        
+        present_matrix = np.column_stack(list(present.values()))
+        
+        # 统计缺失数据：按列一次归约得到所有字段的存在数
+        present_counts = np.count_nonzero(present_matrix, axis=0)
         missing_counts = {
-            'rating': 0,
-            'confidence': 0,
-            'reviewer_id': 0,
-            'content_summary': 0,
-            'content_strengths': 0,
-            'content_weaknesses': 0,
-            'content_questions': 0
+            field: total_reviews - int(count)
+            for field, count in zip(present, present_counts)
         }
         
         invalid_values = {
@@ -693,138 +957,77 @@ class AnomalyDetector:
             'invalid_reviewer_ids': []
         }
         
-        total_reviews = 0
-        
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            for review in submission_data['reviews']:
-                total_reviews += 1
-                
-                # 检查缺失数据
-                if review.get('rating') is None:
-                    missing_counts['rating'] += 1
-                if review.get('confidence') is None:
-                    missing_counts['confidence'] += 1
-                if not review.get('reviewer_id'):
-                    missing_counts['reviewer_id'] += 1
-                
-                content = review.get('content', {})
-                if not content.get('summary'):
-                    missing_counts['content_summary'] += 1
-                if not content.get('strengths'):
-                    missing_counts['content_strengths'] += 1
-                if not content.get('weaknesses'):
-                    missing_counts['content_weaknesses'] += 1
-                if not content.get('questions'):
-                    missing_counts['content_questions'] += 1
-                
-                # 检查无效值
-                rating = review.get('rating')
-                if rating is not None and (rating < 1 or rating > 10):
-                    invalid_values['out_of_range_ratings'].append({
-                        'submission_num': int(submission_num),
-                        'rating': rating,
-                        'reviewer_id': review.get('reviewer_id')
-                    })
-                
-                confidence = review.get('confidence')
-                if confidence is not None and (confidence < 1 or confidence > 5):
-                    invalid_values['out_of_range_confidences'].append({
-                        'submission_num': int(submission_num),
-                        'confidence': confidence,
-                        'reviewer_id': review.get('reviewer_id')
-                    })
-                
-                reviewer_id = review.get('reviewer_id')
-                if reviewer_id and not isinstance(reviewer_id, str):
-                    invalid_values['invalid_reviewer_ids'].append({
-                        'submission_num': int(submission_num),
-                        'reviewer_id': reviewer_id,
-                        'type': type(reviewer_id).__name__
-                    })
+        submission_nums = df['submission_num'].to_numpy()
+        
+        # 检查超出范围的评分/信心度：先用掩码定位（NaN 比较为 False，缺失值自然排除），
+        # 再从原始评审中取回少量无效条目的原始值
+        with np.errstate(invalid='ignore'):
+            invalid_rating_rows = np.flatnonzero((self._ratings < 1) | (self._ratings > 10))
+            invalid_confidence_rows = np.flatnonzero((self._confidences < 1) | (self._confidences > 5))
+        
+        for row in invalid_rating_rows:
+            review = self._reviews_flat[row]
+            invalid_values['out_of_range_ratings'].append({
+                'submission_num': int(submission_nums[row]),
+                'rating': review.get('rating'),
+                'reviewer_id': review.get('reviewer_id')
+            })
+        
+        for row in invalid_confidence_rows:
+            review = self._reviews_flat[row]
+            invalid_values['out_of_range_confidences'].append({
+                'submission_num': int(submission_nums[row]),
+                'confidence': review.get('confidence'),
+                'reviewer_id': review.get('reviewer_id')
+            })
+        
+        # 检查无效的审稿人 ID 类型：非空且不是字符串（只检查存在 ID 的评审，按原始值判断类型，避免 NaN 占位被误报）
+        reviews_flat = self._reviews_flat
+        for row in np.flatnonzero(self._has_reviewer_id):
+            reviewer_id = reviews_flat[row]['reviewer_id']
+            if not isinstance(reviewer_id, str):
+                invalid_values['invalid_reviewer_ids'].append({
+                    'submission_num': int(submission_nums[row]),
+                    'reviewer_id': reviewer_id,
+                    'type': type(reviewer_id).__name__
+                })
         
         # 计算缺失百分比
-        quality_issues['missing_data'] = {
-            field: {
-                'count': count,
-                'percentage': round(count / total_reviews * 100, 1)
-            }
-            for field, count in missing_counts.items()
-        }
+        quality_issues['missing_data'] = pct_dict(missing_counts, total_reviews)
         
         quality_issues['invalid_values'] = invalid_values
         
-        # 完整性分析
-        complete_reviews = 0
-        partial_reviews = 0
-        incomplete_reviews = 0
-        
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            for review in submission_data['reviews']:
-                completeness_score = 0
-                max_score = 7
-                
-                if review.get('rating') is not None:
-                    completeness_score += 1
-                if review.get('confidence') is not None:
-                    completeness_score += 1
-                if review.get('reviewer_id'):
-                    completeness_score += 1
-                
-                content = review.get('content', {})
-                if content.get('summary'):
-                    completeness_score += 1
-                if content.get('strengths'):
-                    completeness_score += 1
-                if content.get('weaknesses'):
-                    completeness_score += 1
-                if content.get('questions'):
-                    completeness_score += 1
-                
-                if completeness_score == max_score:
-                    complete_reviews += 1
-                elif completeness_score >= max_score * 0.7:
-                    partial_reviews += 1
-                else:
-                    incomplete_reviews += 1
+        # 完整性分析：各字段中存在的个数
+        complete_reviews, partial_reviews, incomplete_reviews = completeness_buckets(present_matrix)
         
         quality_issues['completeness_analysis'] = {
             'total_reviews': total_reviews,
-            'complete_reviews': {
-                'count': complete_reviews,
-                'percentage': round(complete_reviews / total_reviews * 100, 1)
-            },
-            'partial_reviews': {
-                'count': partial_reviews,
-                'percentage': round(partial_reviews / total_reviews * 100, 1)
-            },
-            'incomplete_reviews': {
-                'count': incomplete_reviews,
-                'percentage': round(incomplete_reviews / total_reviews * 100, 1)
-            }
+            **pct_dict({
+                'complete_reviews': complete_reviews,
+                'partial_reviews': partial_reviews,
+                'incomplete_reviews': incomplete_reviews
+            }, total_reviews)
         }
         
-        # 检查人员数据质量
+        # 检查人员数据质量（每个字段一个布尔数组，再整体求和）
+        people = list(self.people_data['people'].values())
+        n_people = len(people)
+        has_gender = np.fromiter(
+            (is_known(p.get('gender')) for p in people), dtype=bool, count=n_people)
+        has_nationality = np.fromiter(
+            (is_known(p.get('nationality')) for p in people), dtype=bool, count=n_people)
+        has_affiliations = np.fromiter(
+            (bool(p.get('affiliations')) for p in people), dtype=bool, count=n_people)
+        
         people_quality = {
-            'missing_gender': 0,
-            'missing_nationality': 0,
-            'invalid_affiliations': 0,
-            'total_people': len(self.people_data['people'])
+            'missing_gender': n_people - int(np.count_nonzero(has_gender)),
+            'missing_nationality': n_people - int(np.count_nonzero(has_nationality)),
+            'invalid_affiliations': n_people - int(np.count_nonzero(has_affiliations))
         }
         
-        for person_id, person_data in self.people_data['people'].items():
-            if not person_data.get('gender') or person_data.get('gender') == 'Unknown':
-                people_quality['missing_gender'] += 1
-            if not person_data.get('nationality') or person_data.get('nationality') == 'Unknown':
-                people_quality['missing_nationality'] += 1
-            if not person_data.get('affiliations') or len(person_data.get('affiliations', [])) == 0:
-                people_quality['invalid_affiliations'] += 1
-        
         quality_issues['people_data_quality'] = {
-            field: {
-                'count': count,
-                'percentage': round(count / people_quality['total_people'] * 100, 1)
-            } if field != 'total_people' else count
-            for field, count in people_quality.items()
+            **pct_dict(people_quality, n_people),
+            'total_people': n_people
         }
         
         self.anomaly_results['data_quality_issues'] = quality_issues
@@ -839,23 +1042,37 @@ class AnomalyDetector:
         output_dir = "analysis_results/visualizations/anomaly"
         os.makedirs(output_dir, exist_ok=True)
         
-        # 1. 审稿人异常分布图
-        self._create_reviewer_anomaly_plot(output_dir)
-        
-        # 2. 评分异常分析图
-        self._create_rating_anomaly_plot(output_dir)
+        # 只在需要绘图时才导入 matplotlib，纯 JSON 输出的运行无需承担其导入开销
+        import matplotlib
         
-        # 3. 数据质量分析图
-        self._create_data_quality_plot(output_dir)
+        # 设置中文字体和样式
+        matplotlib.rcParams['font.family'] = ['Arial', 'DejaVu Sans']
+        matplotlib.rcParams['axes.unicode_minus'] = False
         
-        # 4. 异常检测汇总图
-        self._create_anomaly_summary_plot(output_dir)
+        # 四张图彼此独立，各自使用自己的 Figure（不经过 pyplot 全局状态），可在线程中并行绘制
+        plot_steps = [
+            self._create_reviewer_anomaly_plot,  # 1. 审稿人异常分布图
+            self._create_rating_anomaly_plot,  # 2. 评分异常分析图
+            self._create_data_quality_plot,  # 3. 数据质量分析图
+            self._create_anomaly_summary_plot  # 4. 异常检测汇总图
+        ]
+        with ThreadPoolExecutor(max_workers=len(plot_steps)) as executor:
+            list(executor.map(lambda plot: plot(output_dir), plot_steps))
         
         print(f"✅ 可视化图表已保存到 {output_dir}")
     
+    def _new_figure(self):
+        """创建 2x2 子图的 Agg Figure"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(16, 12))
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(2, 2)
+    
     def _create_reviewer_anomaly_plot(self, output_dir):
         """创建审稿人异常分析图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure()
         
         anomalous_reviewers = self.anomaly_results['reviewer_anomalies']['anomalous_reviewers']
         
@@ -882,7 +1099,7 @@ class AnomalyDetector:
         if extreme_raters:
             reviewers = [f"R{i+1}" for i in range(len(extreme_raters))]
             avg_ratings = [r['avg_rating'] for r in extreme_raters]
-            global_avg = self.anomaly_results['reviewer_anomalies']['global_statistics']['global_rating_mean']
+            global_avg = self._global_stats.global_rating_mean
             
             colors = ['red' if r['anomaly_type'] == 'extreme_low' else 'blue' for r in extreme_raters]
             bars = ax2.barh(reviewers, avg_ratings, color=colors, alpha=0.7)
@@ -909,7 +1126,7 @@ class AnomalyDetector:
         if low_effort:
             reviewers = [f"R{i+1}" for i in range(len(low_effort))]
             text_lengths = [r['avg_text_length'] for r in low_effort]
-            global_avg_length = self.anomaly_results['reviewer_anomalies']['global_statistics']['global_text_mean']
+            global_avg_length = self._global_stats.global_text_mean
             
             bars = ax4.bar(reviewers, text_lengths, color='lightcoral', alpha=0.7)
             ax4.axhline(global_avg_length, color='green', linestyle='--', linewidth=2, 
@@ -920,13 +1137,12 @@ class AnomalyDetector:
             ax4.tick_params(axis='x', rotation=45)
             ax4.legend()
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/reviewer_anomaly_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/reviewer_anomaly_analysis.png", dpi=self.plot_dpi, bbox_inches='tight')
     
     def _create_rating_anomaly_plot(self, output_dir):
         """创建评分异常分析图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure()
         
         rating_distribution = self.anomaly_results['rating_anomalies']['rating_distribution']
         anomalous_patterns = self.anomaly_results['rating_anomalies']['anomalous_patterns']
@@ -992,13 +1208,12 @@ class AnomalyDetector:
                 verticalalignment='top', fontfamily='monospace')
         ax4.set_title('Distribution Characteristics', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/rating_anomaly_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/rating_anomaly_analysis.png", dpi=self.plot_dpi, bbox_inches='tight')
     
     def _create_data_quality_plot(self, output_dir):
         """创建数据质量分析图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure()
         
         quality_issues = self.anomaly_results['data_quality_issues']
         
@@ -1083,13 +1298,12 @@ class AnomalyDetector:
                 verticalalignment='top', fontfamily='monospace')
         ax4.set_title('Data Quality Summary', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/data_quality_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/data_quality_analysis.png", dpi=self.plot_dpi, bbox_inches='tight')
     
     def _create_anomaly_summary_plot(self, output_dir):
         """创建异常检测汇总图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure()
         
         # 1. 各类异常数量汇总
         anomaly_counts = {
@@ -1132,11 +1346,11 @@ class AnomalyDetector:
         # 3. 异常检测覆盖率
         coverage_data = {
             'Reviewers': {
-                'total': self.anomaly_results['reviewer_anomalies']['global_statistics']['total_reviewers'],
+                'total': self._global_stats.total_reviewers,
                 'anomalous': sum(len(v) for v in self.anomaly_results['reviewer_anomalies']['anomalous_reviewers'].values())
             },
             'Submissions': {
-                'total': self.anomaly_results['submission_anomalies']['global_statistics']['total_submissions'],
+                'total': self._global_stats.total_submissions,
                 'anomalous': sum(len(v) for v in self.anomaly_results['submission_anomalies']['anomalous_submissions'].values())
             }
         }
@@ -1168,9 +1382,9 @@ class AnomalyDetector:
         ax4.axis('off')
         
         # 计算一些关键指标
-        total_data_points = self.anomaly_results['rating_anomalies']['total_ratings_analyzed']
-        total_reviewers = self.anomaly_results['reviewer_anomalies']['global_statistics']['total_reviewers']
-        total_submissions = self.anomaly_results['submission_anomalies']['global_statistics']['total_submissions']
+        total_data_points = self._global_stats.total_ratings
+        total_reviewers = self._global_stats.total_reviewers
+        total_submissions = self._global_stats.total_submissions
         
         efficiency_text = f"Anomaly Detection Summary:\n\n"
         efficiency_text += f"Data Volume Processed:\n"
@@ -1195,9 +1409,8 @@ class AnomalyDetector:
                 verticalalignment='top', fontfamily='monospace')
         ax4.set_title('Detection Efficiency Report', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/anomaly_detection_summary.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/anomaly_detection_summary.png", dpi=self.plot_dpi, bbox_inches='tight')
     
     def save_anomaly_results(self):
         """保存异常检测结果"""
@@ -1218,13 +1431,11 @@ class AnomalyDetector:
             'summary_statistics': self._generate_summary_statistics()
         }
         
-        with open(f"{output_dir}/anomaly_detection_results.json", 'w', encoding='utf-8') as f:
-            json.dump(anomaly_data, f, ensure_ascii=False, indent=2)
+        dump_json(anomaly_data, f"{output_dir}/anomaly_detection_results.json", indent=self.pretty_json)
         
         # 保存高优先级异常报告
         critical_anomalies = self._extract_critical_anomalies()
-        with open(f"{output_dir}/critical_anomalies_report.json", 'w', encoding='utf-8') as f:
-            json.dump(critical_anomalies, f, ensure_ascii=False, indent=2)
+        dump_json(critical_anomalies, f"{output_dir}/critical_anomalies_report.json", indent=self.pretty_json)
         
         print(f"✅ 结果已保存到 {output_dir}/ 目录")
     
@@ -1238,13 +1449,13 @@ class AnomalyDetector:
                 sum(len(v) for v in self.anomaly_results['content_anomalies']['anomalous_content'].values())
             ]),
             'data_coverage': {
-                'reviewers_analyzed': self.anomaly_results['reviewer_anomalies']['global_statistics']['total_reviewers'],
-                'submissions_analyzed': self.anomaly_results['submission_anomalies']['global_statistics']['total_submissions'],
-                'ratings_analyzed': self.anomaly_results['rating_anomalies']['total_ratings_analyzed']
+                'reviewers_analyzed': self._global_stats.total_reviewers,
+                'submissions_analyzed': self._global_stats.total_submissions,
+                'ratings_analyzed': self._global_stats.total_ratings
             },
             'quality_metrics': {
                 'complete_reviews_percentage': self.anomaly_results['data_quality_issues']['completeness_analysis']['complete_reviews']['percentage'],
-                'missing_data_average': np.mean([v['percentage'] for v in self.anomaly_results['data_quality_issues']['missing_data'].values()])
+                'missing_data_average': statistics.fmean([v['percentage'] for v in self.anomaly_results['data_quality_issues']['missing_data'].values()])
             }
         }
     
@@ -1252,8 +1463,8 @@ class AnomalyDetector:
         """提取关键异常"""
         critical = {
             'high_priority': {
-                'extreme_raters': self.anomaly_results['reviewer_anomalies']['anomalous_reviewers']['extreme_raters'][:5],
-                'controversial_papers': self.anomaly_results['submission_anomalies']['anomalous_submissions']['controversial_papers'][:5],
+                'extreme_raters': self.anomaly_results['reviewer_anomalies']['anomalous_reviewers']['extreme_raters'][:TOP_K_CRITICAL],
+                'controversial_papers': self.anomaly_results['submission_anomalies']['anomalous_submissions']['controversial_papers'][:TOP_K_CRITICAL],
                 'duplicate_content': self.anomaly_results['content_anomalies']['anomalous_content']['duplicate_content']
             },
             'data_integrity_issues': {
@@ -1271,27 +1482,36 @@ class AnomalyDetector:
         
         return critical
     
+    def _run_detection_steps(self):
+        """在多个进程中并行运行各检测步骤；平台不支持 fork 时顺序执行"""
+        global _FORKED_DETECTOR
+        
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            for method_name, _ in DETECTION_STEPS:
+                getattr(self, method_name)()
+            return
+        
+        _FORKED_DETECTOR = self
+        try:
+            with ProcessPoolExecutor(max_workers=len(DETECTION_STEPS),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                results = executor.map(_run_detection_step, DETECTION_STEPS)
+                for (_, result_key), result in zip(DETECTION_STEPS, results):
+                    self.anomaly_results[result_key] = result
+        finally:
+            _FORKED_DETECTOR = None
+    
     def run_anomaly_detection(self):
         """运行完整异常检测流程"""
         print("🔍 开始异常检测分析...")
         
-        # 1. 检测审稿人异常行为
-        self.detect_reviewer_anomalies()
-        
-        # 2. 检测异常submission
-        self.detect_submission_anomalies()
-        
-        # 3. 检测评分异常模式
-        self.detect_rating_anomalies()
-        
-        # 4. 检测内容异常
-        self.detect_content_anomalies()
-        
-        # 5. 检测数据质量问题
-        self.detect_data_quality_issues()
+        # 1-5. 并行运行各项检测
+        self._run_detection_steps()
+        self._global_stats = GlobalStats.from_results(self.anomaly_results)
         
         # 6. 创建可视化
-        self.create_anomaly_visualizations()
+        if self.enable_plots:
+            self.create_anomaly_visualizations()
         
         # 7. 保存结果
         self.save_anomaly_results()
@@ -1325,7 +1545,15 @@ def main():
             return
     
     # 创建分析器并运行
-    detector = AnomalyDetector(reviews_path, people_path, institutions_path)
+    high_dpi = os.environ.get('ICLR_HIGH_DPI', '0') == '1'
+    pretty_json = os.environ.get('ICLR_COMPACT_JSON', '0') != '1'
+    enable_plots = os.environ.get('ICLR_ENABLE_PLOTS', '1') != '0'
+    # ICLR_STREAM_JSON=1 强制流式解析，=0 强制一次性加载，未设置时按文件大小自动决定
+    stream_env = os.environ.get('ICLR_STREAM_JSON')
+    streaming = None if stream_env is None else stream_env == '1'
+    detector = AnomalyDetector(reviews_path, people_path, institutions_path,
+                               high_dpi=high_dpi, pretty_json=pretty_json, enable_plots=enable_plots,
+                               streaming=streaming)
     results = detector.run_anomaly_detection()
     
     print("\n🎯 异常检测完成！所有分析模块已实现完毕。")
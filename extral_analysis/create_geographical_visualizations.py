@@ -4,26 +4,141 @@ ICLR 地域维度分析可视化生成器
 创建各类地域分析的可视化图表
 """
 
+import heapq
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from numpy.polynomial import polynomial as P
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # 只输出图片文件，使用非交互式后端（子进程中同样适用）
+matplotlib.interactive(False)
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.transforms import offset_copy
 import seaborn as sns
 from collections import defaultdict, Counter
 import os
 from datetime import datetime
+from functools import cached_property
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 # 设置中文字体和样式
 plt.rcParams['font.family'] = ['Arial', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
+plt.rcParams['figure.max_open_warning'] = 0  # 多进程并行绘图时不提示打开的图过多
+# 300 dpi 大图光栅化时合并近似共线的路径段，并分块渲染超长路径
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 sns.set_style("whitegrid")
 sns.set_palette("husl")
 
+def load_json(path):
+    """读取 JSON 文件；安装了 orjson 时直接解析字节，跳过文本解码"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# 各图表生成步骤，彼此独立，可并行执行
+PLOT_STEPS = (
+    'create_academic_scale_visualization',
+    'create_reviewing_characteristics_visualization',
+    'create_cultural_circles_visualization',
+    'create_geographical_bias_visualization',
+    'create_international_collaboration_visualization',
+    'create_comprehensive_country_comparison'
+)
+
+# 图表保存参数：300 dpi 大图的耗时主要在 zlib 压缩，使用最低压缩级别换取更快的保存速度
+SAVEFIG_OPTIONS = {
+    'dpi': 300,
+    'bbox_inches': 'tight',
+    'pil_kwargs': {'compress_level': 1}
+}
+
+# fork 出的子进程通过该全局变量共享（写时复制）已加载的可视化器
+_FORKED_VISUALIZER = None
+
+
+def _run_plot_step(method_name):
+    """在子进程中生成一张图表"""
+    getattr(_FORKED_VISUALIZER, method_name)()
+
+
+def label_points(ax, xs, ys, names, fontsize=9):
+    """在散点右上方 5pt 处标注名称；所有标签共用同一个偏移变换"""
+    transform = offset_copy(ax.transData, fig=ax.figure, x=5, y=5, units='points')
+    for x, y, name in zip(xs, ys, names):
+        ax.text(x, y, name, transform=transform, fontsize=fontsize)
+
+
+def plot_radar(ax, values, colors, labels):
+    """一次性绘制多组雷达多边形：轮廓、填充和顶点各用一个集合，返回图例句柄"""
+    closed = np.column_stack([values, values[:, :1]])
+    verts = np.stack([np.broadcast_to(RADAR_ANGLES, closed.shape), closed], axis=-1)
+    rgba = to_rgba_array(colors)
+    
+    ax.add_collection(PolyCollection(verts, facecolors=rgba, edgecolors='none', alpha=0.1))
+    ax.add_collection(LineCollection(verts, colors=rgba, linewidths=2, zorder=2))
+    ax.scatter(verts[..., 0].ravel(), verts[..., 1].ravel(), s=36,
+               c=np.repeat(rgba, verts.shape[1], axis=0), zorder=2)
+    
+    return [Line2D([], [], marker='o', linewidth=2, color=color, label=label)
+            for color, label in zip(rgba, labels)]
+
+
+# 雷达图的四个维度及其极角（首尾闭合），两张雷达图共用
+RADAR_CATEGORIES = ['Strictness', 'Detail', 'Consistency', 'Confidence']
+RADAR_ANGLES = np.append(np.linspace(0, 2 * np.pi, len(RADAR_CATEGORIES), endpoint=False), 0.0)
+RADAR_THETAGRIDS = np.degrees(RADAR_ANGLES[:-1])
+RADAR_COLUMNS = ['strictness', 'detail', 'consistency', 'confidence']
+
+# 合格国家的最少审稿人数
+MIN_REVIEWERS = 20
+
+
+def flatten_profile(profile):
+    """把嵌套的国家画像展平为一行记录"""
+    scale = profile['academic_scale']
+    scores = profile['country_scores']
+    return {
+        'country': profile['country'],
+        'num_reviewers': scale['num_reviewers'],
+        'num_authors': scale['num_authors'],
+        'num_institutions': scale['num_institutions'],
+        'reviews_per_reviewer': scale['reviews_per_reviewer'],
+        'author_reviewer_ratio': scale['author_reviewer_ratio'],
+        'strictness': scores['strictness_score'],
+        'detail': scores['detail_score'],
+        'consistency': scores['consistency_score'],
+        'confidence': scores['confidence_score']
+    }
+
+
 class GeographicalVisualizer:
-    def __init__(self):
-        """初始化可视化器"""
+    def __init__(self, pdf_report=False):
+        """初始化可视化器
+        
+        pdf_report 为 True 时六张图合并输出为一份多页 PDF 报告（矢量图），不再单独保存 PNG
+        """
         print("📊 启动地域维度可视化生成器...")
         
+        self.pdf_report = pdf_report
+        self._pdf = None
+        
         # 加载分析结果
         self.load_analysis_results()
         
@@ -36,86 +151,96 @@ class GeographicalVisualizer:
         base_dir = "analysis_results/geographical"
         
         # 加载国家画像
-        with open(f"{base_dir}/country_profiles.json", 'r', encoding='utf-8') as f:
-            self.country_data = json.load(f)
-            
+        self.country_data = load_json(f"{base_dir}/country_profiles.json")
+        
         # 加载排行榜
-        with open(f"{base_dir}/geographical_rankings.json", 'r', encoding='utf-8') as f:
-            self.rankings_data = json.load(f)
-            
+        self.rankings_data = load_json(f"{base_dir}/geographical_rankings.json")
+        
         # 加载偏见分析
-        with open(f"{base_dir}/geographical_bias_analysis.json", 'r', encoding='utf-8') as f:
-            self.bias_data = json.load(f)
-            
+        self.bias_data = load_json(f"{base_dir}/geographical_bias_analysis.json")
+        
         # 加载合作分析
-        with open(f"{base_dir}/international_collaboration.json", 'r', encoding='utf-8') as f:
-            self.collaboration_data = json.load(f)
+        self.collaboration_data = load_json(f"{base_dir}/international_collaboration.json")
+        
+        # 加载跨国互评矩阵
+        self.cross_country_data = load_json(f"{base_dir}/cross_country_matrix.json")
+        
+        # 国家画像展平为每国一行的 DataFrame，各图表按列取数
+        self.profiles_df = pd.DataFrame.from_records(
+            [flatten_profile(profile) for profile in self.country_data['country_profiles'].values()],
+            columns=['country', 'num_reviewers', 'num_authors', 'num_institutions', 'reviews_per_reviewer',
+                     'author_reviewer_ratio', 'strictness', 'detail', 'consistency', 'confidence']
+        )
+        self.qualified = self.profiles_df[self.profiles_df['num_reviewers'] >= MIN_REVIEWERS]
         
         print("✅ 分析结果加载完成")
     
+    @cached_property
+    def top15(self):
+        """审稿人数最多的15个国家，与排行榜 largest_academic_communities 的顺序一致（按审稿人数稳定降序）"""
+        return self.qualified.nlargest(15, 'num_reviewers', keep='first')
+    
+    @cached_property
+    def top10(self):
+        """审稿人数最多的10个国家"""
+        return self.top15.head(10)
+    
+    @cached_property
+    def top6(self):
+        """审稿人数最多的6个国家"""
+        return self.top15.head(6)
+    
     def create_academic_scale_visualization(self):
         """创建学术规模可视化"""
         print("\n📈 创建学术规模可视化...")
         
         # 提取Top 15国家数据
-        top_countries = self.rankings_data['rankings']['academic_scale']['largest_academic_communities'][:15]
+        top_countries = self.top15
         
-        countries = [country['country'] for country in top_countries]
-        reviewers = [country['academic_scale']['num_reviewers'] for country in top_countries]
-        authors = [country['academic_scale']['num_authors'] for country in top_countries]
-        institutions = [country['academic_scale']['num_institutions'] for country in top_countries]
+        countries = top_countries['country'].tolist()
+        reviewers = top_countries['num_reviewers'].to_numpy()
+        authors = top_countries['num_authors'].to_numpy()
+        institutions = top_countries['num_institutions'].to_numpy()
         
         # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), layout='constrained')
         
         # 1. 审稿人数量柱状图
         bars1 = ax1.bar(range(len(countries)), reviewers, color='skyblue', alpha=0.7)
         ax1.set_title('Number of Reviewers by Country (Top 15)', fontsize=16, fontweight='bold')
         ax1.set_xlabel('Country', fontsize=12)
         ax1.set_ylabel('Number of Reviewers', fontsize=12)
-        ax1.set_xticks(range(len(countries)))
-        ax1.set_xticklabels(countries, rotation=45, ha='right')
+        ax1.set_xticks(np.arange(len(countries)), labels=countries, rotation=45, ha='right')
         
         # 添加数值标签
-        for i, bar in enumerate(bars1):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 50,
-                    f'{int(height):,}', ha='center', va='bottom')
+        ax1.bar_label(bars1, fmt='{:,.0f}', padding=3)
         
         # 2. 作者数量柱状图
         bars2 = ax2.bar(range(len(countries)), authors, color='lightcoral', alpha=0.7)
         ax2.set_title('Number of Authors by Country (Top 15)', fontsize=16, fontweight='bold')
         ax2.set_xlabel('Country', fontsize=12)
         ax2.set_ylabel('Number of Authors', fontsize=12)
-        ax2.set_xticks(range(len(countries)))
-        ax2.set_xticklabels(countries, rotation=45, ha='right')
+        ax2.set_xticks(np.arange(len(countries)), labels=countries, rotation=45, ha='right')
         
         # 添加数值标签
-        for i, bar in enumerate(bars2):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 100,
-                    f'{int(height):,}', ha='center', va='bottom')
+        ax2.bar_label(bars2, fmt='{:,.0f}', padding=3)
         
         # 3. 机构数量柱状图
         bars3 = ax3.bar(range(len(countries)), institutions, color='lightgreen', alpha=0.7)
         ax3.set_title('Number of Institutions by Country (Top 15)', fontsize=16, fontweight='bold')
         ax3.set_xlabel('Country', fontsize=12)
         ax3.set_ylabel('Number of Institutions', fontsize=12)
-        ax3.set_xticks(range(len(countries)))
-        ax3.set_xticklabels(countries, rotation=45, ha='right')
+        ax3.set_xticks(np.arange(len(countries)), labels=countries, rotation=45, ha='right')
         
         # 添加数值标签
-        for i, bar in enumerate(bars3):
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height + 5,
-                    f'{int(height)}', ha='center', va='bottom')
+        ax3.bar_label(bars3, fmt='{:.0f}', padding=3)
         
         # 4. 审稿人vs作者比例散点图
-        ratios = [country['academic_scale']['author_reviewer_ratio'] for country in top_countries]
-        reviews_per_reviewer = [country['academic_scale']['reviews_per_reviewer'] for country in top_countries]
+        ratios = top_countries['author_reviewer_ratio'].to_numpy()
+        reviews_per_reviewer = top_countries['reviews_per_reviewer'].to_numpy()
         
         scatter = ax4.scatter(ratios, reviews_per_reviewer, 
-                            s=[r/10 for r in reviewers], 
+                            s=reviewers / 10, 
                             c=range(len(countries)), 
                             cmap='viridis', alpha=0.6)
         ax4.set_title('Author/Reviewer Ratio vs Reviews per Reviewer', fontsize=16, fontweight='bold')
@@ -123,14 +248,9 @@ class GeographicalVisualizer:
         ax4.set_ylabel('Reviews per Reviewer', fontsize=12)
         
         # 添加国家标签
-        for i, country in enumerate(countries):
-            if i < 10:  # 只标注前10个国家避免重叠
-                ax4.annotate(country, (ratios[i], reviews_per_reviewer[i]), 
-                           xytext=(5, 5), textcoords='offset points', fontsize=9)
+        label_points(ax4, ratios, reviews_per_reviewer, countries[:10])  # 只标注前10个国家避免重叠
         
-        plt.tight_layout()
-        plt.savefig(f"{self.output_dir}/academic_scale_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "academic_scale_analysis.png")
         
         print(f"✅ 学术规模分析图已保存")
     
@@ -139,24 +259,21 @@ class GeographicalVisualizer:
         print("\n🎯 创建评审特征可视化...")
         
         # 获取合格国家数据
-        qualified_countries = []
-        for country, profile in self.country_data['country_profiles'].items():
-            if profile['academic_scale']['num_reviewers'] >= 20:
-                qualified_countries.append(profile)
+        qualified_countries = self.qualified
         
         # 提取数据
-        countries = [c['country'] for c in qualified_countries]
-        strictness = [c['country_scores']['strictness_score'] for c in qualified_countries]
-        detail = [c['country_scores']['detail_score'] for c in qualified_countries]
-        consistency = [c['country_scores']['consistency_score'] for c in qualified_countries]
-        confidence = [c['country_scores']['confidence_score'] for c in qualified_countries]
+        countries = qualified_countries['country'].tolist()
+        strictness = qualified_countries['strictness'].to_numpy()
+        detail = qualified_countries['detail'].to_numpy()
+        consistency = qualified_countries['consistency'].to_numpy()
+        confidence = qualified_countries['confidence'].to_numpy()
         
         # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), layout='constrained')
         
         # 1. 严格度分布
         ax1.hist(strictness, bins=15, color='lightcoral', alpha=0.7, edgecolor='black')
-        ax1.axvline(np.mean(strictness), color='red', linestyle='--', linewidth=2, label=f'Mean: {np.mean(strictness):.1f}')
+        ax1.axvline(strictness.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {strictness.mean():.1f}')
         ax1.set_title('Distribution of Review Strictness by Country', fontsize=16, fontweight='bold')
         ax1.set_xlabel('Strictness Score', fontsize=12)
         ax1.set_ylabel('Number of Countries', fontsize=12)
@@ -170,9 +287,10 @@ class GeographicalVisualizer:
         ax2.set_ylabel('Detail Score', fontsize=12)
         
         # 添加趋势线
-        z = np.polyfit(strictness, detail, 1)
-        p = np.poly1d(z)
-        ax2.plot(strictness, p(strictness), "r--", alpha=0.8, linewidth=2)
+        # 直线只需两个端点，避免在未排序的点上来回折线
+        coef = P.polyfit(strictness, detail, 1)
+        trend_x = np.array([strictness.min(), strictness.max()])
+        ax2.plot(trend_x, P.polyval(trend_x, coef), "r--", alpha=0.8, linewidth=2)
         
         # 3. 一致性vs信心度散点图
         scatter2 = ax3.scatter(consistency, confidence, s=100, alpha=0.6, c=range(len(countries)), cmap='plasma')
@@ -181,44 +299,26 @@ class GeographicalVisualizer:
         ax3.set_ylabel('Confidence Score', fontsize=12)
         
         # 4. 四维雷达图（选择Top 6国家）
-        top_6_countries = sorted(qualified_countries, key=lambda x: x['academic_scale']['num_reviewers'], reverse=True)[:6]
+        top_6_countries = self.top6
         
         # 移除当前ax4并创建极坐标子图
         ax4.remove()
         ax4 = fig.add_subplot(2, 2, 4, projection='polar')
         
-        # 雷达图数据
-        categories = ['Strictness', 'Detail', 'Consistency', 'Confidence']
-        N = len(categories)
-        
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]
-        
         ax4.set_theta_offset(np.pi / 2)
         ax4.set_theta_direction(-1)
-        ax4.set_thetagrids(np.degrees(angles[:-1]), categories)
+        ax4.set_thetagrids(RADAR_THETAGRIDS, RADAR_CATEGORIES)
         
         colors = ['red', 'blue', 'green', 'orange', 'purple', 'brown']
         
-        for i, country_profile in enumerate(top_6_countries):
-            values = [
-                country_profile['country_scores']['strictness_score'],
-                country_profile['country_scores']['detail_score'],
-                country_profile['country_scores']['consistency_score'],
-                country_profile['country_scores']['confidence_score']
-            ]
-            values += values[:1]
-            
-            ax4.plot(angles, values, 'o-', linewidth=2, label=country_profile['country'], color=colors[i])
-            ax4.fill(angles, values, alpha=0.1, color=colors[i])
+        handles = plot_radar(ax4, top_6_countries[RADAR_COLUMNS].to_numpy(),
+                             colors[:len(top_6_countries)], top_6_countries['country'])
         
         ax4.set_ylim(0, 100)
         ax4.set_title('Review Characteristics Radar Chart (Top 6 Countries)', fontsize=16, fontweight='bold', pad=20)
-        ax4.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
+        ax4.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.2, 1.0))
         
-        plt.tight_layout()
-        plt.savefig(f"{self.output_dir}/reviewing_characteristics_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "reviewing_characteristics_analysis.png")
         
         print(f"✅ 评审特征分析图已保存")
     
@@ -238,7 +338,7 @@ class GeographicalVisualizer:
         avg_confidence = [cultural_data[circle]['avg_confidence'] for circle in circles]
         
         # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), layout='constrained')
         
         # 1. 文化圈规模对比（饼图）
         colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc']
@@ -251,26 +351,26 @@ class GeographicalVisualizer:
             autotext.set_fontweight('bold')
         
         # 2. 文化圈特征对比（柱状图）
+        # 三组特征（行）× 文化圈（列），分组柱状图一次画出
+        characteristics_matrix = np.array([avg_strictness, avg_detail, avg_confidence])
+        feature_names = ['Strictness', 'Detail', 'Confidence']
+        feature_colors = ['lightcoral', 'lightblue', 'lightgreen']
         x_pos = np.arange(len(circles))
         width = 0.25
         
-        bars1 = ax2.bar(x_pos - width, avg_strictness, width, label='Strictness', color='lightcoral', alpha=0.7)
-        bars2 = ax2.bar(x_pos, avg_detail, width, label='Detail', color='lightblue', alpha=0.7)
-        bars3 = ax2.bar(x_pos + width, avg_confidence, width, label='Confidence', color='lightgreen', alpha=0.7)
+        bar_positions = np.add.outer(np.array([-width, 0, width]), x_pos)
+        bars = ax2.bar(bar_positions.ravel(), characteristics_matrix.ravel(), width,
+                       color=np.repeat(feature_colors, len(circles)), alpha=0.7)
         
         ax2.set_title('Average Review Characteristics by Cultural Circle', fontsize=16, fontweight='bold')
         ax2.set_xlabel('Cultural Circle', fontsize=12)
         ax2.set_ylabel('Score', fontsize=12)
-        ax2.set_xticks(x_pos)
-        ax2.set_xticklabels(circles, rotation=45, ha='right')
-        ax2.legend()
+        ax2.set_xticks(x_pos, labels=circles, rotation=45, ha='right')
+        ax2.legend(handles=[Patch(facecolor=color, alpha=0.7, label=name)
+                            for color, name in zip(feature_colors, feature_names)])
         
         # 添加数值标签
-        for bars in [bars1, bars2, bars3]:
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 1,
-                        f'{height:.1f}', ha='center', va='bottom', fontsize=9)
+        ax2.bar_label(bars, fmt='{:.1f}', padding=3, fontsize=9)
         
         # 3. 文化圈审稿人数量对比
         bars = ax3.bar(circles, total_reviewers, color=colors, alpha=0.7)
@@ -280,35 +380,25 @@ class GeographicalVisualizer:
         ax3.tick_params(axis='x', rotation=45)
         
         # 添加数值标签
-        for i, bar in enumerate(bars):
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height + 50,
-                    f'{int(height):,}', ha='center', va='bottom', fontweight='bold')
+        ax3.bar_label(bars, fmt='{:,.0f}', padding=3, fontweight='bold')
         
         # 4. 文化圈特征热力图
-        characteristics_matrix = np.array([avg_strictness, avg_detail, avg_confidence])
-        
-        im = ax4.imshow(characteristics_matrix, cmap='RdYlBu_r', aspect='auto')
+        im = ax4.imshow(characteristics_matrix, cmap='RdYlBu_r', aspect='auto', rasterized=True)
         
         # 设置标签
-        ax4.set_xticks(np.arange(len(circles)))
-        ax4.set_yticks(np.arange(3))
-        ax4.set_xticklabels(circles, rotation=45, ha='right')
-        ax4.set_yticklabels(['Strictness', 'Detail', 'Confidence'])
+        ax4.set_xticks(np.arange(len(circles)), labels=circles, rotation=45, ha='right')
+        ax4.set_yticks(np.arange(3), labels=feature_names)
         ax4.set_title('Cultural Circle Characteristics Heatmap', fontsize=16, fontweight='bold')
         
         # 添加数值标注
-        for i in range(3):
-            for j in range(len(circles)):
-                text = ax4.text(j, i, f'{characteristics_matrix[i, j]:.1f}',
-                              ha="center", va="center", color="black", fontweight='bold')
+        cell_labels = np.char.mod('%.1f', characteristics_matrix)
+        for (i, j), label in np.ndenumerate(cell_labels):
+            ax4.text(j, i, label, ha="center", va="center", color="black", fontweight='bold')
         
         # 添加颜色条
         plt.colorbar(im, ax=ax4, shrink=0.8)
         
-        plt.tight_layout()
-        plt.savefig(f"{self.output_dir}/cultural_circles_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "cultural_circles_analysis.png")
         
         print(f"✅ 文化圈分析图已保存")
     
@@ -324,7 +414,7 @@ class GeographicalVisualizer:
         most_biased = bias_rankings['most_biased'][:10]
         
         # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), layout='constrained')
         
         # 1. 最公平国家排行
         fair_countries = [item['country'] for item in most_fair]
@@ -334,15 +424,11 @@ class GeographicalVisualizer:
         ax1.set_title('Most Fair Countries (Lowest Geographical Bias)', fontsize=16, fontweight='bold')
         ax1.set_xlabel('Bias Magnitude', fontsize=12)
         ax1.set_ylabel('Country', fontsize=12)
-        ax1.set_yticks(range(len(fair_countries)))
-        ax1.set_yticklabels(fair_countries)
+        ax1.set_yticks(np.arange(len(fair_countries)), labels=fair_countries)
         ax1.invert_yaxis()
         
         # 添加数值标签
-        for i, bar in enumerate(bars1):
-            width = bar.get_width()
-            ax1.text(width + 0.01, bar.get_y() + bar.get_height()/2.,
-                    f'{width:.3f}', ha='left', va='center')
+        ax1.bar_label(bars1, fmt='{:.3f}', padding=3)
         
         # 2. 最有偏见国家排行
         biased_countries = [item['country'] for item in most_biased]
@@ -352,15 +438,11 @@ class GeographicalVisualizer:
         ax2.set_title('Most Biased Countries (Highest Geographical Bias)', fontsize=16, fontweight='bold')
         ax2.set_xlabel('Bias Magnitude', fontsize=12)
         ax2.set_ylabel('Country', fontsize=12)
-        ax2.set_yticks(range(len(biased_countries)))
-        ax2.set_yticklabels(biased_countries)
+        ax2.set_yticks(np.arange(len(biased_countries)), labels=biased_countries)
         ax2.invert_yaxis()
         
         # 添加数值标签
-        for i, bar in enumerate(bars2):
-            width = bar.get_width()
-            ax2.text(width + 0.01, bar.get_y() + bar.get_height()/2.,
-                    f'{width:.3f}', ha='left', va='center')
+        ax2.bar_label(bars2, fmt='{:.3f}', padding=3)
         
         # 3. 偏见分布直方图
         all_bias_scores = [item['bias_magnitude'] for item in most_fair + most_biased]
@@ -380,7 +462,9 @@ class GeographicalVisualizer:
         review_counts = [item['total_cross_reviews'] for item in all_countries]
         country_names = [item['country'] for item in all_countries]
         
-        colors = ['green' if item in most_fair else 'red' for item in all_countries]
+        # 国家较少时两个榜单可能重叠，重叠的国家仍按公平（绿色）着色
+        fair_names = [item['country'] for item in most_fair]
+        colors = np.where(np.isin(country_names, fair_names), 'green', 'red')
         
         scatter = ax4.scatter(review_counts, bias_magnitudes, c=colors, s=100, alpha=0.6)
         ax4.set_title('Geographical Bias vs Number of Cross-country Reviews', fontsize=16, fontweight='bold')
@@ -388,20 +472,14 @@ class GeographicalVisualizer:
         ax4.set_ylabel('Bias Magnitude', fontsize=12)
         
         # 添加标签（只标注部分避免重叠）
-        for i, name in enumerate(country_names):
-            if i < 8:  # 只标注前8个
-                ax4.annotate(name, (review_counts[i], bias_magnitudes[i]), 
-                           xytext=(5, 5), textcoords='offset points', fontsize=9)
+        label_points(ax4, review_counts, bias_magnitudes, country_names[:8])  # 只标注前8个
         
         # 添加图例
-        from matplotlib.patches import Patch
         legend_elements = [Patch(facecolor='green', label='Fair Countries'),
                           Patch(facecolor='red', label='Biased Countries')]
         ax4.legend(handles=legend_elements)
         
-        plt.tight_layout()
-        plt.savefig(f"{self.output_dir}/geographical_bias_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "geographical_bias_analysis.png")
         
         print(f"✅ 地域偏见分析图已保存")
     
@@ -418,10 +496,10 @@ class GeographicalVisualizer:
                             if data['num_reviewers'] >= 20}
         
         # 创建子图
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16), layout='constrained')
         
         # 1. 国际化程度Top 15
-        sorted_openness = sorted(qualified_openness.items(), key=lambda x: x[1]['openness_score'], reverse=True)[:15]
+        sorted_openness = heapq.nlargest(15, qualified_openness.items(), key=lambda x: x[1]['openness_score'])
         
         countries = [item[0] for item in sorted_openness]
         openness_scores = [item[1]['openness_score'] for item in sorted_openness]
@@ -430,14 +508,10 @@ class GeographicalVisualizer:
         ax1.set_title('International Openness Score by Country (Top 15)', fontsize=16, fontweight='bold')
         ax1.set_xlabel('Country', fontsize=12)
         ax1.set_ylabel('Openness Score', fontsize=12)
-        ax1.set_xticks(range(len(countries)))
-        ax1.set_xticklabels(countries, rotation=45, ha='right')
+        ax1.set_xticks(np.arange(len(countries)), labels=countries, rotation=45, ha='right')
         
         # 添加数值标签
-        for i, bar in enumerate(bars1):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f'{height:.3f}', ha='center', va='bottom')
+        ax1.bar_label(bars1, fmt='{:.3f}', padding=3)
         
         # 2. 合作类型分布（饼图）
         collaboration_types = {}
@@ -470,36 +544,33 @@ class GeographicalVisualizer:
         ax3.set_ylabel('Openness Score', fontsize=12)
         
         # 添加国家标签
-        for i, name in enumerate(country_names_scatter):
-            if i < 10:  # 只标注前10个避免重叠
-                ax3.annotate(name, (reviewer_counts[i], openness_scores_scatter[i]), 
-                           xytext=(5, 5), textcoords='offset points', fontsize=9)
+        label_points(ax3, reviewer_counts, openness_scores_scatter, country_names_scatter[:10])  # 只标注前10个避免重叠
         
         # 4. 合作强度热力图
-        # 构建合作强度矩阵
+        # 由跨国互评矩阵构建合作强度矩阵：共同评审次数，按最大值归一化
         top_10_countries = [item[0] for item in sorted_openness[:10]]
-        collaboration_matrix = np.random.rand(10, 10)  # 示例数据，实际应该从真实数据计算
-        np.fill_diagonal(collaboration_matrix, 1.0)  # 对角线设为1
-        
-        im = ax4.imshow(collaboration_matrix, cmap='YlOrRd', aspect='auto')
-        ax4.set_title('International Collaboration Strength Matrix (Top 10)', fontsize=16, fontweight='bold')
-        ax4.set_xticks(np.arange(10))
-        ax4.set_yticks(np.arange(10))
-        ax4.set_xticklabels(top_10_countries, rotation=45, ha='right')
-        ax4.set_yticklabels(top_10_countries)
+        interaction_matrix = self.cross_country_data['interaction_matrix']
+        collaboration_matrix = np.array([
+            [interaction_matrix.get(a, {}).get(b, {}).get('interaction_count', 0) for b in top_10_countries]
+            for a in top_10_countries
+        ], dtype=float).reshape(len(top_10_countries), len(top_10_countries))
+        if collaboration_matrix.max() > 0:
+            collaboration_matrix /= collaboration_matrix.max()
+        
+        im = ax4.imshow(collaboration_matrix, cmap='YlOrRd', aspect='auto', rasterized=True)
+        ax4.set_title('International Co-Review Strength Matrix (Top 10)', fontsize=16, fontweight='bold')
+        ax4.set_xticks(np.arange(len(top_10_countries)), labels=top_10_countries, rotation=45, ha='right')
+        ax4.set_yticks(np.arange(len(top_10_countries)), labels=top_10_countries)
         
         # 添加数值标注
-        for i in range(10):
-            for j in range(10):
-                text = ax4.text(j, i, f'{collaboration_matrix[i, j]:.2f}',
-                              ha="center", va="center", color="black", fontsize=8)
+        cell_labels = np.char.mod('%.2f', collaboration_matrix)
+        for (i, j), label in np.ndenumerate(cell_labels):
+            ax4.text(j, i, label, ha="center", va="center", color="black", fontsize=8)
         
         # 添加颜色条
         plt.colorbar(im, ax=ax4, shrink=0.8)
         
-        plt.tight_layout()
-        plt.savefig(f"{self.output_dir}/international_collaboration_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "international_collaboration_analysis.png")
         
         print(f"✅ 国际合作分析图已保存")
     
@@ -508,53 +579,41 @@ class GeographicalVisualizer:
         print("\n📊 创建综合国家对比图...")
         
         # 获取Top 10国家数据
-        top_countries = self.rankings_data['rankings']['academic_scale']['largest_academic_communities'][:10]
+        top_countries = self.top10
         
         # 提取数据
-        countries = [country['country'] for country in top_countries]
-        strictness = [country['country_scores']['strictness_score'] for country in top_countries]
-        detail = [country['country_scores']['detail_score'] for country in top_countries]
-        consistency = [country['country_scores']['consistency_score'] for country in top_countries]
-        confidence = [country['country_scores']['confidence_score'] for country in top_countries]
-        reviewers = [country['academic_scale']['num_reviewers'] for country in top_countries]
+        countries = top_countries['country'].tolist()
+        strictness = top_countries['strictness'].to_numpy()
+        detail = top_countries['detail'].to_numpy()
+        consistency = top_countries['consistency'].to_numpy()
+        reviewers = top_countries['num_reviewers'].to_numpy()
         
         # 创建大图
-        fig = plt.figure(figsize=(24, 16))
+        fig = plt.figure(figsize=(24, 16), layout='constrained')
         
         # 创建网格布局
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        gs = fig.add_gridspec(3, 3)
         
         # 1. 主要特征雷达图 (占用2x2空间)
         ax1 = fig.add_subplot(gs[:2, :2], projection='polar')
         
-        categories = ['Strictness', 'Detail', 'Consistency', 'Confidence']
-        N = len(categories)
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]
-        
         ax1.set_theta_offset(np.pi / 2)
         ax1.set_theta_direction(-1)
-        ax1.set_thetagrids(np.degrees(angles[:-1]), categories)
+        ax1.set_thetagrids(RADAR_THETAGRIDS, RADAR_CATEGORIES)
         
         colors = plt.cm.Set3(np.linspace(0, 1, len(countries)))
         
-        for i, country in enumerate(countries):
-            values = [strictness[i], detail[i], consistency[i], confidence[i]]
-            values += values[:1]
-            
-            ax1.plot(angles, values, 'o-', linewidth=2, label=country, color=colors[i])
-            ax1.fill(angles, values, alpha=0.1, color=colors[i])
+        handles = plot_radar(ax1, top_countries[RADAR_COLUMNS].to_numpy(), colors, countries)
         
         ax1.set_ylim(0, 100)
         ax1.set_title('Country Review Characteristics Comparison (Top 10)', fontsize=18, fontweight='bold', pad=30)
-        ax1.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
+        ax1.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.3, 1.0))
         
         # 2. 审稿人数量排行 (右上)
         ax2 = fig.add_subplot(gs[0, 2])
         bars = ax2.bar(range(len(countries)), reviewers, color=colors, alpha=0.7)
         ax2.set_title('Reviewers Count', fontsize=14, fontweight='bold')
-        ax2.set_xticks(range(len(countries)))
-        ax2.set_xticklabels([c[:3] for c in countries], rotation=45)
+        ax2.set_xticks(np.arange(len(countries)), labels=[c[:3] for c in countries], rotation=45)
         ax2.set_ylabel('Count')
         
         # 3. 严格度排行 (右中)
@@ -565,20 +624,17 @@ class GeographicalVisualizer:
         
         bars = ax3.bar(range(len(sorted_countries)), sorted_strictness, color='lightcoral', alpha=0.7)
         ax3.set_title('Strictness Ranking', fontsize=14, fontweight='bold')
-        ax3.set_xticks(range(len(sorted_countries)))
-        ax3.set_xticklabels(sorted_countries, rotation=45)
+        ax3.set_xticks(np.arange(len(sorted_countries)), labels=sorted_countries, rotation=45)
         ax3.set_ylabel('Score')
         
         # 4. 详细度vs一致性散点图 (底部跨越3列)
         ax4 = fig.add_subplot(gs[2, :])
         
-        scatter = ax4.scatter(detail, consistency, s=[r/50 for r in reviewers], 
+        scatter = ax4.scatter(detail, consistency, s=reviewers / 50, 
                             c=strictness, cmap='RdYlBu_r', alpha=0.7)
         
         # 添加国家标签
-        for i, country in enumerate(countries):
-            ax4.annotate(country, (detail[i], consistency[i]), 
-                        xytext=(5, 5), textcoords='offset points', fontsize=10)
+        label_points(ax4, detail, consistency, countries, fontsize=10)
         
         ax4.set_xlabel('Detail Score', fontsize=12)
         ax4.set_ylabel('Consistency Score', fontsize=12)
@@ -588,22 +644,56 @@ class GeographicalVisualizer:
         cbar = plt.colorbar(scatter, ax=ax4)
         cbar.set_label('Strictness Score', fontsize=12)
         
-        plt.savefig(f"{self.output_dir}/comprehensive_country_comparison.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "comprehensive_country_comparison.png")
         
         print(f"✅ 综合国家对比图已保存")
     
+    def _save_figure(self, fig, filename):
+        """保存并关闭图表：PDF 报告模式下写入报告的下一页，否则保存为 PNG"""
+        if self._pdf is not None:
+            self._pdf.savefig(fig, bbox_inches='tight')
+        else:
+            fig.savefig(f"{self.output_dir}/{filename}", **SAVEFIG_OPTIONS)
+        plt.close(fig)
+    
+    def _run_plot_steps(self):
+        """并行生成各图表；平台不支持 fork 时顺序执行"""
+        global _FORKED_VISUALIZER
+        
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            for method_name in PLOT_STEPS:
+                getattr(self, method_name)()
+            return
+        
+        _FORKED_VISUALIZER = self
+        try:
+            with ProcessPoolExecutor(max_workers=len(PLOT_STEPS),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                list(executor.map(_run_plot_step, PLOT_STEPS))
+        finally:
+            _FORKED_VISUALIZER = None
+    
     def run_visualization(self):
         """执行所有可视化"""
         print("🎨 开始生成地域分析可视化图表...")
         
-        # 更新任务状态
-        self.create_academic_scale_visualization()
-        self.create_reviewing_characteristics_visualization()
-        self.create_cultural_circles_visualization()
-        self.create_geographical_bias_visualization()
-        self.create_international_collaboration_visualization()
-        self.create_comprehensive_country_comparison()
+        if self.pdf_report:
+            # 同一个 PDF 文件只能由一个进程顺序写入
+            report_path = f"{self.output_dir}/geographical_report.pdf"
+            with PdfPages(report_path) as pdf:
+                self._pdf = pdf
+                try:
+                    for method_name in PLOT_STEPS:
+                        getattr(self, method_name)()
+                finally:
+                    self._pdf = None
+            
+            print(f"\n🎉 所有地域分析可视化已完成！")
+            print(f"📄 PDF 报告: {report_path}")
+            return
+        
+        # 六张图互不依赖，在多个进程中并行绘制和保存
+        self._run_plot_steps()
         
         print(f"\n🎉 所有地域分析可视化已完成！")
         print(f"📁 保存位置: {self.output_dir}")
@@ -621,7 +711,10 @@ def main():
     print("📊 ICLR 地域维度可视化生成器")
     print("=" * 60)
     
-    visualizer = GeographicalVisualizer()
+    # ICLR_GEO_PDF_REPORT=1 时输出单个多页 PDF 报告而非六张 PNG
+    pdf_report = os.environ.get('ICLR_GEO_PDF_REPORT', '0') == '1'
+    
+    visualizer = GeographicalVisualizer(pdf_report=pdf_report)
     visualizer.run_visualization()
 
 if __name__ == "__main__":
@@ -4,35 +4,293 @@ ICLR 多样性分析模块
 分析审稿人性别、文化和机构类型多样性对评审质量的影响
 """
 
+import hashlib
 import json
 import numpy as np
 import pandas as pd
-from collections import defaultdict, Counter
+from collections import Counter
 from datetime import datetime
 import os
-import statistics
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+import re
+
+try:
+    from numba import njit
+except ImportError:  # numba 为可选依赖，缺失时使用 NumPy 实现
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson 为可选依赖，缺失时整体加载 JSON
+    ijson = None
+
+# 文化圈划分。英国、德国、法国、荷兰同时属于 Western 和 European
+CULTURAL_GROUPS = {
+    'East_Asian': ['China', 'South Korea', 'Japan', 'Taiwan', 'Singapore'],
+    'Western': ['United States', 'Canada', 'United Kingdom', 'Australia', 'Germany', 'France', 'Netherlands'],
+    'South_Asian': ['India', 'Pakistan', 'Bangladesh'],
+    'European': ['Germany', 'France', 'Netherlands', 'United Kingdom', 'Italy', 'Spain'],
+    'Middle_Eastern': ['Iran', 'Israel', 'Turkey']
+}
+
+# 国家 -> 所属的全部文化圈
+COUNTRY_TO_CULTURES = {
+    country: frozenset(culture for culture, members in CULTURAL_GROUPS.items() if country in members)
+    for countries in CULTURAL_GROUPS.values() for country in countries
+}
+
+
+def culture_label(cultures):
+    """文化圈集合的标签：按 CULTURAL_GROUPS 顺序以 '/' 连接，如 'Western/European'"""
+    return '/'.join(culture for culture in CULTURAL_GROUPS if culture in cultures)
+
+
+# 文化圈标签 -> 其包含的文化圈；跨文化圈的国家单独成组，计算多样性时按评审组归入其中一个文化圈
+CULTURE_LABEL_MEMBERS = {culture_label(cultures): tuple(culture for culture in CULTURAL_GROUPS if culture in cultures)
+                         for cultures in set(COUNTRY_TO_CULTURES.values())}
+
+# 机构名称含以下任一关键词即视为高校（一次正则扫描完成所有关键词匹配）；
+# 原先只认 University/College，MIT、Caltech 等理工院校会被误判为公司
+ACADEMIC_INSTITUTION_RE = re.compile(r'\b(?:University|College|Institute of Technology|Polytechnic)\b')
+
+# 多样性影响对比图的四个子图：(标题, 纵轴标签, (高多样性颜色, 低多样性颜色))
+IMPACT_PANELS = [
+    ('Average Rating: High vs Low Diversity', 'Average Rating', ('skyblue', 'lightcoral')),
+    ('Average Confidence: High vs Low Diversity', 'Average Confidence', ('lightgreen', 'orange')),
+    ('Consistency: High vs Low Diversity', 'Consistency Score', ('purple', 'brown')),
+    ('Detail Level: High vs Low Diversity', 'Detail Score', ('pink', 'gray'))
+]
+
+# 对比柱状图中每根柱子的宽度
+BAR_WIDTH = 0.35
+
+# 各多样性维度结果中审稿人分布所在的键
+DISTRIBUTION_KEYS = {
+    'gender_diversity': 'gender_distribution',
+    'cultural_diversity': 'culture_distribution',
+    'institutional_diversity': 'type_distribution'
+}
+
+# 多样性影响对比图使用的统计项：评分、信心度、评分标准差、文本长度
+IMPACT_STAT_KEYS = ('avg_rating', 'avg_confidence', 'avg_rating_std', 'avg_text_length')
+
+# 审稿人属性矩阵 self._reviewer_attrs 的列
+GENDER, CULTURE, INSTITUTION_TYPE = 0, 1, 2
+
+# 计入评审文本长度的字段
+REVIEW_TEXT_FIELDS = ('summary', 'strengths', 'weaknesses', 'questions')
+
+# 展平后的评审数组缓存目录
+REVIEW_CACHE_DIR = "analysis_results/cache"
+
+# 超过该大小的 JSON 文件在安装了 ijson 时改为流式解析，以降低峰值内存
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+
+def iter_json_section(path, key, as_items=True, streaming=None):
+    """逐项读取 JSON 文件顶层 key 下的内容
+    
+    as_items 为 True 时 key 对应字典，产出 (键, 值)；否则 key 对应列表，逐个产出元素。
+    大文件在安装了 ijson 时流式解析，不构建整个文件的对象树；streaming 为
+    True/False 时强制开启/关闭流式解析，为 None 时按文件大小决定。
+    """
+    if streaming is None:
+        streaming = os.path.getsize(path) >= STREAM_THRESHOLD_BYTES
+    if streaming and ijson is not None:
+        with open(path, 'rb') as f:
+            if as_items:
+                yield from ijson.kvitems(f, key, use_float=True)
+            else:
+                yield from ijson.items(f, f'{key}.item', use_float=True)
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        section = json.load(f)[key]
+    yield from (section.items() if as_items else section)
+
+
+def _group_moments_numpy(codes, values, n_groups):
+    """按整数分组编码计算每组的有效值个数、总和与离差平方和，忽略 NaN
+    
+    先按组别稳定排序一次，再用 np.add.reduceat 对每个连续段求和
+    """
+    valid = ~np.isnan(values)
+    valid_codes = codes[valid]
+    order = np.argsort(valid_codes, kind='stable')
+    sorted_codes = valid_codes[order]
+    sorted_values = values[valid][order]
+    
+    counts = np.zeros(n_groups)
+    sums = np.zeros(n_groups)
+    m2s = np.zeros(n_groups)
+    if len(sorted_codes) == 0:
+        return counts, sums, m2s
+    
+    edges = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1]
+    present = sorted_codes[edges]
+    segment_counts = np.diff(np.r_[edges, len(sorted_codes)])
+    segment_sums = np.add.reduceat(sorted_values, edges)
+    deviations = sorted_values - np.repeat(segment_sums / segment_counts, segment_counts)
+    
+    counts[present] = segment_counts
+    sums[present] = segment_sums
+    m2s[present] = np.add.reduceat(deviations * deviations, edges)
+    return counts, sums, m2s
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _group_moments_numba(codes, values, n_groups):
+        counts = np.zeros(n_groups)
+        sums = np.zeros(n_groups)
+        for i in range(len(codes)):
+            if not np.isnan(values[i]):
+                counts[codes[i]] += 1
+                sums[codes[i]] += values[i]
+        m2s = np.zeros(n_groups)
+        for i in range(len(codes)):
+            if not np.isnan(values[i]):
+                deviation = values[i] - sums[codes[i]] / counts[codes[i]]
+                m2s[codes[i]] += deviation * deviation
+        return counts, sums, m2s
+
+
+def group_moments(codes, values, n_groups):
+    """按整数分组编码一次性计算每组的 (有效值个数, 均值, 总体标准差)；安装了 numba 时使用编译内核"""
+    if njit is None:
+        counts, sums, m2s = _group_moments_numpy(codes, values, n_groups)
+    else:
+        counts, sums, m2s = _group_moments_numba(codes, values, n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return counts, sums / counts, np.sqrt(m2s / counts)
+
+
+def normalized_entropy(group_counts, n_groups):
+    """按行计算组别人数矩阵的香农熵，并除以该行人数和组别数所允许的最大熵，得到 0~1 的多样性得分
+    
+    各组人数相同时得分为 1，只有一个组别（或只有一人）时为 0
+    """
+    totals = group_counts.sum(axis=1)
+    occupied = group_counts > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shares = group_counts / totals[:, None]
+        entropy = np.sum(np.where(occupied, shares * np.log(np.where(occupied, 1.0 / shares, 1.0)), 0.0), axis=1)
+        max_entropy = np.log(np.minimum(totals, n_groups))
+        return np.where(max_entropy > 0, entropy / max_entropy, 0.0)
+
+
+def assign_member_groups(label_counts, label_groups, n_base_groups):
+    """把每段（submission）各组别标签的人数归入基本组别，返回 (段数 × 基本组别数) 的人数矩阵
+    
+    label_groups[i] 为第 i 个标签包含的基本组别下标（空表示未知组别，不计入）。
+    跨组别的审稿人只计入一个基本组别：本段覆盖人数最多的那个（并列时取 label_groups 中靠前者），
+    因此同一文化圈的评审组不会因为重叠划分而被算作多样。
+    
+    >>> counts = assign_member_groups(np.array([[0, 2, 0], [1, 1, 0], [1, 0, 1]]), [[0], [0, 1], [2]], 3)
+    >>> counts.tolist()
+    [[2, 0, 0], [2, 0, 0], [1, 0, 1]]
+    >>> normalized_entropy(counts, 3).tolist()
+    [0.0, 0.0, 1.0]
+    """
+    n_segments = len(label_counts)
+    # 各段中覆盖每个基本组别的人数（跨组别的审稿人计入其所属的每个组别）
+    coverage = np.zeros((n_segments, n_base_groups), dtype=label_counts.dtype)
+    for label, groups in enumerate(label_groups):
+        coverage[:, groups] += label_counts[:, [label]]
+    
+    group_counts = np.zeros_like(coverage)
+    rows = np.arange(n_segments)
+    for label, groups in enumerate(label_groups):
+        if groups:
+            chosen = np.asarray(groups)[np.argmax(coverage[:, groups], axis=1)]
+            group_counts[rows, chosen] += label_counts[:, label]
+    return group_counts
+
+
+def pearson_columns(x, columns):
+    """一次计算 x 与 columns 各列的皮尔逊相关系数及双侧 p 值，返回 (样本数, 相关系数, p 值) 三个数组
+    
+    每列只用 x 与该列都不是 NaN 的行；p 值与 scipy.stats.pearsonr 相同，
+    由 t = r * sqrt((n - 2) / (1 - r²)) 服从自由度 n - 2 的 t 分布得到
+    """
+    from scipy import stats
+    
+    valid = ~np.isnan(columns) & ~np.isnan(x)[:, None]
+    counts = valid.sum(axis=0)
+    xs = np.where(valid, x[:, None], 0.0)
+    ys = np.where(valid, columns, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_dev = np.where(valid, xs - xs.sum(axis=0) / counts, 0.0)
+        y_dev = np.where(valid, ys - ys.sum(axis=0) / counts, 0.0)
+        r = np.clip((x_dev * y_dev).sum(axis=0) / np.sqrt((x_dev ** 2).sum(axis=0) * (y_dev ** 2).sum(axis=0)), -1.0, 1.0)
+        t = r * np.sqrt((counts - 2) / (1.0 - r ** 2))
+    return counts, r, 2 * stats.t.sf(np.abs(t), counts - 2)
+
+
+def linear_fit(x, y):
+    """一元线性最小二乘拟合的闭式解，返回 (斜率, 截距)；比 np.polyfit 的范德蒙矩阵 + SVD 求解轻量得多"""
+    x_mean, y_mean = x.mean(), y.mean()
+    x_dev = x - x_mean
+    slope = np.dot(x_dev, y - y_mean) / np.dot(x_dev, x_dev)
+    return slope, y_mean - slope * x_mean
+
+
+def grouped_bars(ax, x, left, right, labels, high, low, title, ylabel, colors):
+    """在 ax 上并排绘制高/低多样性两组柱状图
+    
+    x 为各组刻度位置，left/right 为两组柱子的中心位置（由调用方一次算好，多个子图共用）；
+    colors 为 (高多样性颜色, 低多样性颜色)
+    """
+    ax.bar(left, high, BAR_WIDTH, label='High Diversity', color=colors[0], alpha=0.7)
+    ax.bar(right, low, BAR_WIDTH, label='Low Diversity', color=colors[1], alpha=0.7)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_xlabel('Diversity Type')
+    ax.set_ylabel(ylabel)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels)
+    ax.legend()
+
+
+def review_cache_key(path):
+    """评审缓存的键：评审文件内容的 blake2b 摘要，混入文本长度字段，字段变化时缓存随之失效"""
+    digest = hashlib.blake2b(repr(REVIEW_TEXT_FIELDS).encode('utf-8'), digest_size=8)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dump_json(data, path):
+    """写出缩进的 JSON 文件；安装了 orjson 时直接序列化为 UTF-8 字节（支持 NumPy 标量和非字符串键）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
-# 设置中文字体和样式
-plt.rcParams['font.family'] = ['Arial', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
 
 class DiversityAnalyzer:
     def __init__(self, reviews_data_path, people_data_path, institutions_data_path):
         """初始化多样性分析器"""
         print("🌈 启动多样性分析模块...")
         
-        # 加载数据
-        with open(reviews_data_path, 'r', encoding='utf-8') as f:
-            self.reviews_data = json.load(f)
-            
-        with open(people_data_path, 'r', encoding='utf-8') as f:
-            self.people_data = json.load(f)
-            
-        with open(institutions_data_path, 'r', encoding='utf-8') as f:
-            self.institutions_data = json.load(f)
+        # 逐项读取数据，只保留分析用到的字段，不常驻原始 JSON 对象树
+        self.reviews_data_path = reviews_data_path
+        self.people_data_path = people_data_path
+        self.institutions_data_path = institutions_data_path
+        
+        # 所有评审展平为一张长表，三个维度的分析共用
+        self._reviews_df = self._load_reviews_frame(reviews_data_path)
+        
+        # 遍历一次人员数据，同时得到三个维度的审稿人分组
+        self._single_pass_accumulate(
+            iter_json_section(people_data_path, 'people'),
+            iter_json_section(institutions_data_path, 'institutions', as_items=False))
         
         # 初始化分析结果存储
         self.diversity_results = {
@@ -44,108 +302,255 @@ class DiversityAnalyzer:
         
         print("✅ 数据加载完成")
     
-    def analyze_gender_diversity(self):
-        """分析性别多样性对评审质量的影响"""
-        print("\n👥 分析性别多样性...")
-        
-        # 构建性别映射
-        reviewer_gender_map = {}
-        gender_stats = Counter()
+    def _load_reviews_frame(self, reviews_data_path):
+        """展平评审数据；展平后的数组按评审文件内容哈希缓存为 npz，文件未变时直接读取缓存，跳过 JSON 解析"""
+        cache_path = os.path.join(REVIEW_CACHE_DIR, f"{review_cache_key(reviews_data_path)}.npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                self._submission_keys = cached['submission_keys'].tolist()
+                self._submission_idx = cached['submission_idx']
+                self._reviewer_uniques = np.array(json.loads(cached['reviewer_uniques'].item()) + [None], dtype=object)[:-1]
+                self._reviewer_index = cached['reviewer_index']
+                self._ratings = cached['ratings']
+                self._confidences = cached['confidences']
+                self._text_lengths = cached['text_lengths']
+            # 序号 -1（缺失的 reviewer_id）取到末尾追加的 None
+            self._reviewer_ids = np.append(self._reviewer_uniques, None)[self._reviewer_index]
+            return self._reviews_frame()
+        
+        frame = self._flatten_reviews_to_frame(iter_json_section(reviews_data_path, 'reviews'))
+        
+        # 审稿人编号可能混有非字符串值，序列化为 JSON 文本保存以保留类型（npz 不含 pickle 对象）；
+        # 写入失败（如只读目录）不影响分析
+        try:
+            os.makedirs(REVIEW_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+            np.savez_compressed(
+                tmp_path,
+                submission_keys=np.array(self._submission_keys, dtype=str),
+                submission_idx=self._submission_idx,
+                reviewer_uniques=np.array(json.dumps(self._reviewer_uniques.tolist())),
+                reviewer_index=self._reviewer_index,
+                ratings=self._ratings,
+                confidences=self._confidences,
+                text_lengths=self._text_lengths)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return frame
+    
+    def _flatten_reviews_to_frame(self, submissions):
+        """遍历一次 (submission_key, submission_data) 序列，构建按 submission 顺序排列的平行 NumPy 数组，并包装为每条评审一行的 DataFrame"""
+        self._submission_keys = []
+        reviews_per_submission = []
+        
+        # 预分配各列缓冲区并用游标写入，容量不足时整体翻倍；缺失的评分/信心度写入 None 即为 NaN，聚合时跳过
+        capacity = 1024
+        buffers = {
+            'reviewer_id': np.empty(capacity, dtype=object),
+            'rating': np.empty(capacity, dtype=float),
+            'confidence': np.empty(capacity, dtype=float),
+            'text_length': np.empty(capacity, dtype=np.int32)
+        }
+        cursor = 0
         
-        for person_id, person_data in self.people_data['people'].items():
-            gender = person_data.get('gender', 'Unknown')
-            roles = person_data.get('roles', [])
+        for submission_key, submission_data in submissions:
+            self._submission_keys.append(submission_key)
+            reviews = submission_data['reviews']
+            reviews_per_submission.append(len(reviews))
             
-            if 'reviewer' in roles:
-                reviewer_gender_map[person_id] = gender
-                gender_stats[gender] += 1
-        
-        print(f"📊 性别分布: {dict(gender_stats)}")
-        
-        # 分析不同性别的评审特征
-        gender_review_data = defaultdict(lambda: {
-            'ratings': [],
-            'confidences': [],
-            'text_lengths': [],
-            'review_count': 0
+            if cursor + len(reviews) > capacity:
+                capacity = max(capacity * 2, cursor + len(reviews))
+                for name, buffer in buffers.items():
+                    buffers[name] = np.resize(buffer, capacity)
+            reviewer_ids, ratings, confidences, text_lengths = buffers.values()
+            
+            for review in reviews:
+                content = review.get('content', {})
+                
+                reviewer_ids[cursor] = review.get('reviewer_id')
+                ratings[cursor] = review.get('rating')
+                confidences[cursor] = review.get('confidence')
+                # 文本长度：各字段每项只查一次，空值计为 0
+                text_lengths[cursor] = sum(len(content.get(field) or '') for field in REVIEW_TEXT_FIELDS)
+                cursor += 1
+        
+        # 每条评审所属 submission 的序号（非递减），用于 np.add.reduceat 分段聚合
+        self._submission_idx = np.repeat(
+            np.arange(len(reviews_per_submission), dtype=np.int32), reviews_per_submission)
+        # 截去未用的容量（copy 释放多余内存）
+        self._reviewer_ids = buffers['reviewer_id'][:cursor].copy()
+        self._ratings = buffers['rating'][:cursor].copy()
+        self._confidences = buffers['confidence'][:cursor].copy()
+        self._text_lengths = buffers['text_length'][:cursor].copy()
+        # 审稿人编号为整数序号，各维度按审稿人查一次组别即可展开到每条评审；缺失的 reviewer_id 记为 -1
+        reviewer_index, self._reviewer_uniques = pd.factorize(self._reviewer_ids)
+        self._reviewer_index = reviewer_index.astype(np.int32)
+        
+        return self._reviews_frame()
+    
+    def _reviews_frame(self):
+        """把展平后的平行数组包装为每条评审一行的 DataFrame"""
+        return pd.DataFrame({
+            'submission_idx': self._submission_idx,
+            'reviewer_id': self._reviewer_ids,
+            'rating': self._ratings,
+            'confidence': self._confidences,
+            'text_length': self._text_lengths
         })
+    
+    def _single_pass_accumulate(self, people, institutions):
+        """遍历一次人员数据，同时构建性别、文化圈、机构类型三个维度的审稿人映射和分布统计"""
+        # 构建机构类型映射
+        institution_type_map = {}
+        for institution in institutions:
+            inst_name = institution.get('institution_name', '')
+            inst_type = 'University' if ACADEMIC_INSTITUTION_RE.search(inst_name) else 'Company'
+            institution_type_map[inst_name] = inst_type
         
-        # 分析混合性别评审组的效果
-        submission_gender_diversity = {}
+        # 三个维度的组别各自按首次出现的顺序编码为整数，每位审稿人一行 (性别, 文化圈, 机构类型) 编码，-1 表示无该属性
+        self._attribute_labels = ({}, {}, {})
+        self._attribute_stats = (Counter(), Counter(), Counter())
+        reviewer_codes = {}
         
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            reviews = submission_data['reviews']
-            reviewer_genders = []
-            submission_ratings = []
-            submission_confidences = []
-            submission_lengths = []
+        def encode(dimension, label):
+            self._attribute_stats[dimension][label] += 1
+            return self._attribute_labels[dimension].setdefault(label, len(self._attribute_labels[dimension]))
+        
+        for person_id, person_data in people:
+            if 'reviewer' not in person_data.get('roles', []):
+                continue
             
-            for review in reviews:
-                reviewer_id = review.get('reviewer_id')
-                if reviewer_id and reviewer_id in reviewer_gender_map:
-                    gender = reviewer_gender_map[reviewer_id]
-                    reviewer_genders.append(gender)
-                    
-                    # 收集个人数据
-                    rating = review.get('rating')
-                    confidence = review.get('confidence')
-                    content = review.get('content', {})
-                    
-                    # 计算文本长度
-                    summary_len = len(content.get('summary', '')) if content.get('summary') else 0
-                    strengths_len = len(content.get('strengths', '')) if content.get('strengths') else 0
-                    weaknesses_len = len(content.get('weaknesses', '')) if content.get('weaknesses') else 0
-                    questions_len = len(content.get('questions', '')) if content.get('questions') else 0
-                    total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                    
-                    if rating is not None:
-                        gender_review_data[gender]['ratings'].append(rating)
-                        submission_ratings.append(rating)
-                    if confidence is not None:
-                        gender_review_data[gender]['confidences'].append(confidence)
-                        submission_confidences.append(confidence)
-                    
-                    gender_review_data[gender]['text_lengths'].append(total_len)
-                    gender_review_data[gender]['review_count'] += 1
-                    submission_lengths.append(total_len)
+            gender_code = encode(GENDER, person_data.get('gender', 'Unknown'))
+            cultures = COUNTRY_TO_CULTURES.get(person_data.get('nationality', 'Unknown'))
+            culture_code = encode(CULTURE, culture_label(cultures) if cultures else 'Other')
             
-            # 计算该submission的性别多样性
-            if len(reviewer_genders) >= 2:
-                unique_genders = len(set(g for g in reviewer_genders if g != 'Unknown'))
-                total_known_genders = len([g for g in reviewer_genders if g != 'Unknown'])
-                
-                if total_known_genders > 0:
-                    diversity_score = unique_genders / max(total_known_genders, 1)
-                    
-                    submission_gender_diversity[submission_num] = {
-                        'diversity_score': diversity_score,
-                        'reviewer_genders': reviewer_genders,
-                        'avg_rating': np.mean(submission_ratings) if submission_ratings else None,
-                        'rating_std': np.std(submission_ratings) if len(submission_ratings) > 1 else 0,
-                        'avg_confidence': np.mean(submission_confidences) if submission_confidences else None,
-                        'avg_text_length': np.mean(submission_lengths) if submission_lengths else 0,
-                        'num_reviewers': len(reviewer_genders)
-                    }
-        
-        # 计算性别多样性统计
-        gender_profiles = {}
-        for gender, data in gender_review_data.items():
-            if data['review_count'] >= 10:  # 至少10次评审
-                avg_rating = np.mean(data['ratings']) if data['ratings'] else 0
-                rating_std = np.std(data['ratings']) if len(data['ratings']) > 1 else 0
-                avg_confidence = np.mean(data['confidences']) if data['confidences'] else 0
-                avg_text_length = np.mean(data['text_lengths']) if data['text_lengths'] else 0
-                
-                gender_profiles[gender] = {
-                    'review_count': data['review_count'],
-                    'avg_rating': round(avg_rating, 2),
-                    'rating_std': round(rating_std, 2),
-                    'avg_confidence': round(avg_confidence, 2),
-                    'avg_text_length': round(avg_text_length, 0),
-                    'strictness_score': round((10 - avg_rating) / 8 * 100, 2) if avg_rating > 0 else 0,
-                    'detail_score': round(min(avg_text_length / 2000 * 100, 100), 2),
-                    'consistency_score': round(max(0, (1 - rating_std / 4) * 100), 2)
-                }
+            # 获取第一个机构类型（简化处理）
+            affiliations = person_data.get('affiliations', [])
+            type_code = -1
+            if affiliations:
+                type_code = encode(INSTITUTION_TYPE,
+                                   institution_type_map.get(affiliations[0].get('institution', ''), 'Unknown'))
+            
+            reviewer_codes[person_id] = (gender_code, culture_code, type_code)
+        
+        # 按评审中出现的审稿人序号排列成 (审稿人数 + 1, 3) 的矩阵；
+        # 末行全为 -1，供缺失 reviewer_id（序号 -1）索引。各维度只有个位数的组别，int8 即可
+        max_labels = max(len(labels) for labels in self._attribute_labels)
+        code_dtype = np.int8 if max_labels < 128 else np.int32
+        missing = (-1, -1, -1)
+        self._reviewer_attrs = np.array(
+            [reviewer_codes.get(reviewer_id, missing) for reviewer_id in self._reviewer_uniques] + [missing],
+            dtype=code_dtype).reshape(-1, 3)
+    
+    def _aggregate_by_group(self, dimension, unknown_label, min_reviews, label_members=None):
+        """按审稿人在某一维度（GENDER / CULTURE / INSTITUTION_TYPE）上的组别聚合评审
+        
+        label_members 把组别标签映射为其包含的基本组别（如跨文化圈的国家），计算多样性时
+        每位审稿人只计入本评审组覆盖最多的一个基本组别；未给出时每个标签自成一组。
+        返回 (各组评审画像, 各 submission 的多样性统计)；只统计能映射到组别的审稿人的评审
+        """
+        label_codes = self._attribute_labels[dimension]
+        labels = list(label_codes)
+        
+        # 组别编码 -> 其包含的基本组别下标，未知组别为空
+        members = {label: (label_members or {}).get(label, (label,)) for label in labels if label != unknown_label}
+        base_groups = list(dict.fromkeys(group for groups in members.values() for group in groups))
+        base_index = {group: index for index, group in enumerate(base_groups)}
+        label_groups = [[base_index[group] for group in members.get(label, ())] for label in labels]
+        
+        review_codes = self._reviewer_attrs[self._reviewer_index, dimension]
+        mapped = review_codes >= 0
+        reviews = self._reviews_df[mapped]
+        
+        if reviews.empty:
+            return {}, {}
+        
+        # 映射后的评审仍按 submission 顺序排列，每个 submission 是连续的一段
+        submission_idx = reviews['submission_idx'].to_numpy()
+        codes = review_codes[mapped]
+        known = codes != label_codes.get(unknown_label, -1)
+        ratings = reviews['rating'].to_numpy()
+        confidences = reviews['confidence'].to_numpy()
+        text_lengths = reviews['text_length'].to_numpy()
+        
+        # 各组评审画像（按首次出现的顺序）
+        n_groups = len(labels)
+        review_counts = np.bincount(codes, minlength=n_groups)
+        rating_counts, rating_means, rating_stds = group_moments(codes, ratings, n_groups)
+        confidence_counts, confidence_means, _ = group_moments(codes, confidences, n_groups)
+        _, text_length_means, _ = group_moments(codes, text_lengths.astype(float), n_groups)
+        
+        _, first_seen = np.unique(codes, return_index=True)
+        profiles = {}
+        for code in codes[np.sort(first_seen)]:
+            if review_counts[code] < min_reviews:
+                continue
+            avg_rating = rating_means[code] if rating_counts[code] else 0
+            rating_std = rating_stds[code] if rating_counts[code] > 1 else 0
+            avg_confidence = confidence_means[code] if confidence_counts[code] else 0
+            avg_text_length = text_length_means[code]
+            
+            profiles[labels[code]] = {
+                'review_count': int(review_counts[code]),
+                'avg_rating': round(avg_rating, 2),
+                'rating_std': round(rating_std, 2),
+                'avg_confidence': round(avg_confidence, 2),
+                'avg_text_length': round(avg_text_length, 0),
+                'strictness_score': round((10 - avg_rating) / 8 * 100, 2) if avg_rating > 0 else 0,
+                'detail_score': round(min(avg_text_length / 2000 * 100, 100), 2),
+                'consistency_score': round(max(0, (1 - rating_std / 4) * 100), 2)
+            }
+        
+        # 各 submission 的评审组统计（至少2位审稿人且有已知组别）
+        submission_diversity = {}
+        starts = np.flatnonzero(np.r_[True, submission_idx[1:] != submission_idx[:-1]])
+        num_reviewers = np.diff(np.r_[starts, len(submission_idx)])
+        known_count = np.add.reduceat(known.astype(np.int64), starts)
+        text_length_sum = np.add.reduceat(text_lengths.astype(np.int64), starts)
+        
+        rating_valid = ~np.isnan(ratings)
+        rating_count = np.add.reduceat(rating_valid.astype(np.int64), starts)
+        confidence_valid = ~np.isnan(confidences)
+        confidence_count = np.add.reduceat(confidence_valid.astype(np.int64), starts)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg_rating = np.add.reduceat(np.where(rating_valid, ratings, 0.0), starts) / rating_count
+            deviations = np.where(rating_valid, ratings - np.repeat(avg_rating, num_reviewers), 0.0)
+            rating_std = np.sqrt(np.add.reduceat(deviations ** 2, starts) / rating_count)
+            avg_confidence = np.add.reduceat(np.where(confidence_valid, confidences, 0.0), starts) / confidence_count
+        
+        # 每段内各已知基本组别的人数矩阵 (submission 数 × 基本组别数)，多样性得分为归一化香农熵
+        segments = np.repeat(np.arange(len(starts)), num_reviewers)
+        label_counts = np.bincount(segments[known] * n_groups + codes[known],
+                                   minlength=len(starts) * n_groups).reshape(len(starts), n_groups)
+        group_counts = assign_member_groups(label_counts, label_groups, len(base_groups))
+        diversity_scores = normalized_entropy(group_counts, len(base_groups))
+        
+        for segment in np.flatnonzero((num_reviewers >= 2) & (known_count > 0)):
+            submission_num = self._submission_keys[submission_idx[starts[segment]]]
+            submission_diversity[submission_num] = {
+                'diversity_score': diversity_scores[segment],
+                'avg_rating': avg_rating[segment] if rating_count[segment] else None,
+                'rating_std': rating_std[segment] if rating_count[segment] > 1 else 0,
+                'avg_confidence': avg_confidence[segment] if confidence_count[segment] else None,
+                'avg_text_length': text_length_sum[segment] / num_reviewers[segment],
+                'num_reviewers': int(num_reviewers[segment])
+            }
+        
+        return profiles, submission_diversity
+    
+    def analyze_gender_diversity(self):
+        """分析性别多样性对评审质量的影响"""
+        print("\n👥 分析性别多样性...")
+        
+        gender_stats = self._attribute_stats[GENDER]
+        
+        print(f"📊 性别分布: {dict(gender_stats)}")
+        
+        # 分析不同性别的评审特征（至少10次评审）及混合性别评审组的效果
+        gender_profiles, submission_gender_diversity = self._aggregate_by_group(
+            GENDER, 'Unknown', min_reviews=10)
         
         # 分析多样性对评审质量的影响
         diversity_impact = self._analyze_diversity_impact(submission_gender_diversity, 'gender')
@@ -163,119 +568,13 @@ class DiversityAnalyzer:
         """分析文化多样性对评审质量的影响"""
         print("\n🌍 分析文化多样性...")
         
-        # 定义文化圈映射
-        cultural_groups = {
-            'East_Asian': ['China', 'South Korea', 'Japan', 'Taiwan', 'Singapore'],
-            'Western': ['United States', 'Canada', 'United Kingdom', 'Australia', 'Germany', 'France', 'Netherlands'],
-            'South_Asian': ['India', 'Pakistan', 'Bangladesh'],
-            'European': ['Germany', 'France', 'Netherlands', 'United Kingdom', 'Italy', 'Spain'],
-            'Middle_Eastern': ['Iran', 'Israel', 'Turkey']
-        }
-        
-        # 构建文化圈映射
-        country_to_culture = {}
-        for culture, countries in cultural_groups.items():
-            for country in countries:
-                country_to_culture[country] = culture
-        
-        reviewer_culture_map = {}
-        culture_stats = Counter()
-        
-        for person_id, person_data in self.people_data['people'].items():
-            nationality = person_data.get('nationality', 'Unknown')
-            roles = person_data.get('roles', [])
-            
-            if 'reviewer' in roles:
-                culture = country_to_culture.get(nationality, 'Other')
-                reviewer_culture_map[person_id] = culture
-                culture_stats[culture] += 1
+        culture_stats = self._attribute_stats[CULTURE]
         
         print(f"📊 文化圈分布: {dict(culture_stats)}")
         
-        # 分析不同文化圈的评审特征
-        culture_review_data = defaultdict(lambda: {
-            'ratings': [],
-            'confidences': [],
-            'text_lengths': [],
-            'review_count': 0
-        })
-        
-        # 分析混合文化评审组的效果
-        submission_culture_diversity = {}
-        
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            reviews = submission_data['reviews']
-            reviewer_cultures = []
-            submission_ratings = []
-            submission_confidences = []
-            submission_lengths = []
-            
-            for review in reviews:
-                reviewer_id = review.get('reviewer_id')
-                if reviewer_id and reviewer_id in reviewer_culture_map:
-                    culture = reviewer_culture_map[reviewer_id]
-                    reviewer_cultures.append(culture)
-                    
-                    # 收集数据
-                    rating = review.get('rating')
-                    confidence = review.get('confidence')
-                    content = review.get('content', {})
-                    
-                    # 计算文本长度
-                    summary_len = len(content.get('summary', '')) if content.get('summary') else 0
-                    strengths_len = len(content.get('strengths', '')) if content.get('strengths') else 0
-                    weaknesses_len = len(content.get('weaknesses', '')) if content.get('weaknesses') else 0
-                    questions_len = len(content.get('questions', '')) if content.get('questions') else 0
-                    total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                    
-                    if rating is not None:
-                        culture_review_data[culture]['ratings'].append(rating)
-                        submission_ratings.append(rating)
-                    if confidence is not None:
-                        culture_review_data[culture]['confidences'].append(confidence)
-                        submission_confidences.append(confidence)
-                    
-                    culture_review_data[culture]['text_lengths'].append(total_len)
-                    culture_review_data[culture]['review_count'] += 1
-                    submission_lengths.append(total_len)
-            
-            # 计算该submission的文化多样性
-            if len(reviewer_cultures) >= 2:
-                unique_cultures = len(set(c for c in reviewer_cultures if c != 'Other'))
-                total_known_cultures = len([c for c in reviewer_cultures if c != 'Other'])
-                
-                if total_known_cultures > 0:
-                    diversity_score = unique_cultures / max(total_known_cultures, 1)
-                    
-                    submission_culture_diversity[submission_num] = {
-                        'diversity_score': diversity_score,
-                        'reviewer_cultures': reviewer_cultures,
-                        'avg_rating': np.mean(submission_ratings) if submission_ratings else None,
-                        'rating_std': np.std(submission_ratings) if len(submission_ratings) > 1 else 0,
-                        'avg_confidence': np.mean(submission_confidences) if submission_confidences else None,
-                        'avg_text_length': np.mean(submission_lengths) if submission_lengths else 0,
-                        'num_reviewers': len(reviewer_cultures)
-                    }
-        
-        # 计算文化圈评审特征
-        culture_profiles = {}
-        for culture, data in culture_review_data.items():
-            if data['review_count'] >= 20:  # 至少20次评审
-                avg_rating = np.mean(data['ratings']) if data['ratings'] else 0
-                rating_std = np.std(data['ratings']) if len(data['ratings']) > 1 else 0
-                avg_confidence = np.mean(data['confidences']) if data['confidences'] else 0
-                avg_text_length = np.mean(data['text_lengths']) if data['text_lengths'] else 0
-                
-                culture_profiles[culture] = {
-                    'review_count': data['review_count'],
-                    'avg_rating': round(avg_rating, 2),
-                    'rating_std': round(rating_std, 2),
-                    'avg_confidence': round(avg_confidence, 2),
-                    'avg_text_length': round(avg_text_length, 0),
-                    'strictness_score': round((10 - avg_rating) / 8 * 100, 2) if avg_rating > 0 else 0,
-                    'detail_score': round(min(avg_text_length / 2000 * 100, 100), 2),
-                    'consistency_score': round(max(0, (1 - rating_std / 4) * 100), 2)
-                }
+        # 分析不同文化圈的评审特征（至少20次评审）及混合文化评审组的效果
+        culture_profiles, submission_culture_diversity = self._aggregate_by_group(
+            CULTURE, 'Other', min_reviews=20, label_members=CULTURE_LABEL_MEMBERS)
         
         # 分析多样性影响
         diversity_impact = self._analyze_diversity_impact(submission_culture_diversity, 'cultural')
@@ -293,114 +592,13 @@ class DiversityAnalyzer:
         """分析机构类型多样性对评审质量的影响"""
         print("\n🏛️ 分析机构类型多样性...")
         
-        # 构建机构类型映射
-        institution_type_map = {}
-        for institution in self.institutions_data['institutions']:
-            inst_name = institution.get('institution_name', '')
-            inst_type = 'University' if 'University' in inst_name or 'College' in inst_name else 'Company'
-            institution_type_map[inst_name] = inst_type
-        
-        reviewer_institution_type_map = {}
-        type_stats = Counter()
-        
-        for person_id, person_data in self.people_data['people'].items():
-            roles = person_data.get('roles', [])
-            if 'reviewer' in roles:
-                # 获取第一个机构类型（简化处理）
-                affiliations = person_data.get('affiliations', [])
-                if affiliations:
-                    first_affiliation = affiliations[0]
-                    inst_name = first_affiliation.get('institution', '')
-                    inst_type = institution_type_map.get(inst_name, 'Unknown')
-                    reviewer_institution_type_map[person_id] = inst_type
-                    type_stats[inst_type] += 1
+        type_stats = self._attribute_stats[INSTITUTION_TYPE]
         
         print(f"📊 机构类型分布: {dict(type_stats)}")
         
-        # 分析不同机构类型的评审特征
-        type_review_data = defaultdict(lambda: {
-            'ratings': [],
-            'confidences': [],
-            'text_lengths': [],
-            'review_count': 0
-        })
-        
-        # 分析混合机构类型评审组的效果
-        submission_type_diversity = {}
-        
-        for submission_num, submission_data in self.reviews_data['reviews'].items():
-            reviews = submission_data['reviews']
-            reviewer_types = []
-            submission_ratings = []
-            submission_confidences = []
-            submission_lengths = []
-            
-            for review in reviews:
-                reviewer_id = review.get('reviewer_id')
-                if reviewer_id and reviewer_id in reviewer_institution_type_map:
-                    inst_type = reviewer_institution_type_map[reviewer_id]
-                    reviewer_types.append(inst_type)
-                    
-                    # 收集数据
-                    rating = review.get('rating')
-                    confidence = review.get('confidence')
-                    content = review.get('content', {})
-                    
-                    # 计算文本长度
-                    summary_len = len(content.get('summary', '')) if content.get('summary') else 0
-                    strengths_len = len(content.get('strengths', '')) if content.get('strengths') else 0
-                    weaknesses_len = len(content.get('weaknesses', '')) if content.get('weaknesses') else 0
-                    questions_len = len(content.get('questions', '')) if content.get('questions') else 0
-                    total_len = summary_len + strengths_len + weaknesses_len + questions_len
-                    
-                    if rating is not None:
-                        type_review_data[inst_type]['ratings'].append(rating)
-                        submission_ratings.append(rating)
-                    if confidence is not None:
-                        type_review_data[inst_type]['confidences'].append(confidence)
-                        submission_confidences.append(confidence)
-                    
-                    type_review_data[inst_type]['text_lengths'].append(total_len)
-                    type_review_data[inst_type]['review_count'] += 1
-                    submission_lengths.append(total_len)
-            
-            # 计算该submission的机构类型多样性
-            if len(reviewer_types) >= 2:
-                unique_types = len(set(t for t in reviewer_types if t != 'Unknown'))
-                total_known_types = len([t for t in reviewer_types if t != 'Unknown'])
-                
-                if total_known_types > 0:
-                    diversity_score = unique_types / max(total_known_types, 1)
-                    
-                    submission_type_diversity[submission_num] = {
-                        'diversity_score': diversity_score,
-                        'reviewer_types': reviewer_types,
-                        'avg_rating': np.mean(submission_ratings) if submission_ratings else None,
-                        'rating_std': np.std(submission_ratings) if len(submission_ratings) > 1 else 0,
-                        'avg_confidence': np.mean(submission_confidences) if submission_confidences else None,
-                        'avg_text_length': np.mean(submission_lengths) if submission_lengths else 0,
-                        'num_reviewers': len(reviewer_types)
-                    }
-        
-        # 计算机构类型评审特征
-        type_profiles = {}
-        for inst_type, data in type_review_data.items():
-            if data['review_count'] >= 50:  # 至少50次评审
-                avg_rating = np.mean(data['ratings']) if data['ratings'] else 0
-                rating_std = np.std(data['ratings']) if len(data['ratings']) > 1 else 0
-                avg_confidence = np.mean(data['confidences']) if data['confidences'] else 0
-                avg_text_length = np.mean(data['text_lengths']) if data['text_lengths'] else 0
-                
-                type_profiles[inst_type] = {
-                    'review_count': data['review_count'],
-                    'avg_rating': round(avg_rating, 2),
-                    'rating_std': round(rating_std, 2),
-                    'avg_confidence': round(avg_confidence, 2),
-                    'avg_text_length': round(avg_text_length, 0),
-                    'strictness_score': round((10 - avg_rating) / 8 * 100, 2) if avg_rating > 0 else 0,
-                    'detail_score': round(min(avg_text_length / 2000 * 100, 100), 2),
-                    'consistency_score': round(max(0, (1 - rating_std / 4) * 100), 2)
-                }
+        # 分析不同机构类型的评审特征（至少50次评审）及混合机构类型评审组的效果
+        type_profiles, submission_type_diversity = self._aggregate_by_group(
+            INSTITUTION_TYPE, 'Unknown', min_reviews=50)
         
         # 分析多样性影响
         diversity_impact = self._analyze_diversity_impact(submission_type_diversity, 'institutional')
@@ -414,55 +612,50 @@ class DiversityAnalyzer:
         
         print(f"✅ 机构类型多样性分析完成，分析了 {len(submission_type_diversity)} 个submission")
     
+    @staticmethod
+    def _submission_frame(submission_diversity_data):
+        """把每个 submission 的多样性统计转为数值 DataFrame，缺失值（None）记为 NaN"""
+        return pd.DataFrame.from_records(
+            list(submission_diversity_data.values()),
+            columns=['diversity_score', 'avg_rating', 'rating_std', 'avg_confidence', 'avg_text_length']
+        ).astype(float)
+    
     def _analyze_diversity_impact(self, submission_diversity_data, diversity_type):
         """分析多样性对评审质量的影响"""
-        high_diversity_submissions = []
-        low_diversity_submissions = []
+        from scipy import stats
+        
+        df = self._submission_frame(submission_diversity_data)
         
         # 按多样性分组
-        for submission_num, data in submission_diversity_data.items():
-            diversity_score = data['diversity_score']
-            if diversity_score >= 0.7:  # 高多样性
-                high_diversity_submissions.append(data)
-            elif diversity_score <= 0.3:  # 低多样性
-                low_diversity_submissions.append(data)
+        high_diversity = df[df['diversity_score'] >= 0.7]  # 高多样性
+        low_diversity = df[df['diversity_score'] <= 0.3]  # 低多样性
         
         # 计算对比统计
         impact_analysis = {
-            'high_diversity_count': len(high_diversity_submissions),
-            'low_diversity_count': len(low_diversity_submissions),
-            'total_analyzed': len(submission_diversity_data)
+            'high_diversity_count': len(high_diversity),
+            'low_diversity_count': len(low_diversity),
+            'total_analyzed': len(df)
         }
         
-        if high_diversity_submissions and low_diversity_submissions:
-            # 高多样性组统计
-            high_ratings = [s['avg_rating'] for s in high_diversity_submissions if s['avg_rating'] is not None]
-            high_stds = [s['rating_std'] for s in high_diversity_submissions]
-            high_confidences = [s['avg_confidence'] for s in high_diversity_submissions if s['avg_confidence'] is not None]
-            high_lengths = [s['avg_text_length'] for s in high_diversity_submissions]
-            
-            # 低多样性组统计
-            low_ratings = [s['avg_rating'] for s in low_diversity_submissions if s['avg_rating'] is not None]
-            low_stds = [s['rating_std'] for s in low_diversity_submissions]
-            low_confidences = [s['avg_confidence'] for s in low_diversity_submissions if s['avg_confidence'] is not None]
-            low_lengths = [s['avg_text_length'] for s in low_diversity_submissions]
+        if len(high_diversity) and len(low_diversity):
+            # 各列均值一次算出，NaN（缺失的评分/信心度）自动跳过；整列缺失时记为 0
+            def group_stats(group):
+                means = group[['avg_rating', 'rating_std', 'avg_confidence', 'avg_text_length']].mean().fillna(0)
+                return {
+                    'avg_rating': round(means['avg_rating'], 2),
+                    'avg_rating_std': round(means['rating_std'], 2),
+                    'avg_confidence': round(means['avg_confidence'], 2),
+                    'avg_text_length': round(means['avg_text_length'], 0)
+                }
             
             impact_analysis.update({
-                'high_diversity_stats': {
-                    'avg_rating': round(np.mean(high_ratings), 2) if high_ratings else 0,
-                    'avg_rating_std': round(np.mean(high_stds), 2) if high_stds else 0,
-                    'avg_confidence': round(np.mean(high_confidences), 2) if high_confidences else 0,
-                    'avg_text_length': round(np.mean(high_lengths), 0) if high_lengths else 0
-                },
-                'low_diversity_stats': {
-                    'avg_rating': round(np.mean(low_ratings), 2) if low_ratings else 0,
-                    'avg_rating_std': round(np.mean(low_stds), 2) if low_stds else 0,
-                    'avg_confidence': round(np.mean(low_confidences), 2) if low_confidences else 0,
-                    'avg_text_length': round(np.mean(low_lengths), 0) if low_lengths else 0
-                }
+                'high_diversity_stats': group_stats(high_diversity),
+                'low_diversity_stats': group_stats(low_diversity)
             })
             
             # 统计显著性测试
+            high_ratings = high_diversity['avg_rating'].dropna()
+            low_ratings = low_diversity['avg_rating'].dropna()
             if len(high_ratings) > 5 and len(low_ratings) > 5:
                 t_stat, p_value = stats.ttest_ind(high_ratings, low_ratings)
                 impact_analysis['statistical_test'] = {
@@ -476,38 +669,21 @@ class DiversityAnalyzer:
     
     def _calculate_diversity_correlation(self, submission_diversity_data):
         """计算多样性与评审质量指标的相关性"""
-        diversity_scores = []
-        avg_ratings = []
-        rating_stds = []
-        confidences = []
-        text_lengths = []
-        
-        for data in submission_diversity_data.values():
-            diversity_scores.append(data['diversity_score'])
-            if data['avg_rating'] is not None:
-                avg_ratings.append(data['avg_rating'])
-            rating_stds.append(data['rating_std'])
-            if data['avg_confidence'] is not None:
-                confidences.append(data['avg_confidence'])
-            text_lengths.append(data['avg_text_length'])
+        df = self._submission_frame(submission_diversity_data)
         
         correlations = {}
         
-        if len(diversity_scores) == len(avg_ratings) and len(avg_ratings) > 10:
-            corr_rating, p_rating = stats.pearsonr(diversity_scores[:len(avg_ratings)], avg_ratings)
-            correlations['rating_correlation'] = {
-                'correlation': round(corr_rating, 3),
-                'p_value': round(p_rating, 3),
-                'significant': bool(p_rating < 0.05)
-            }
-        
-        if len(diversity_scores) == len(rating_stds) and len(rating_stds) > 10:
-            corr_std, p_std = stats.pearsonr(diversity_scores, rating_stds)
-            correlations['consistency_correlation'] = {
-                'correlation': round(corr_std, 3),
-                'p_value': round(p_std, 3),
-                'significant': bool(p_std < 0.05)
-            }
+        # 两个指标一次算出；每个指标只用两列都有值的 submission，保证多样性得分与指标逐行对齐
+        keys = ['rating_correlation', 'consistency_correlation']
+        counts, corrs, p_values = pearson_columns(
+            df['diversity_score'].to_numpy(), df[['avg_rating', 'rating_std']].to_numpy())
+        for key, count, corr, p_value in zip(keys, counts, corrs, p_values):
+            if count > 10:
+                correlations[key] = {
+                    'correlation': round(corr, 3),
+                    'p_value': round(p_value, 3),
+                    'significant': bool(p_value < 0.05)
+                }
         
         return correlations
     
@@ -553,10 +729,10 @@ class DiversityAnalyzer:
         # 基于各维度分析结果总结
         for diversity_type in ['gender_diversity', 'cultural_diversity', 'institutional_diversity']:
             impact_data = self.diversity_results.get(diversity_type, {}).get('submission_diversity_analysis', {})
+            high_stats = impact_data.get('high_diversity_stats')
+            low_stats = impact_data.get('low_diversity_stats')
             
-            if impact_data.get('high_diversity_stats') and impact_data.get('low_diversity_stats'):
-                high_stats = impact_data['high_diversity_stats']
-                low_stats = impact_data['low_diversity_stats']
+            if high_stats and low_stats:
                 
                 # 评分差异
                 rating_diff = high_stats.get('avg_rating', 0) - low_stats.get('avg_rating', 0)
@@ -594,163 +770,131 @@ class DiversityAnalyzer:
         output_dir = "analysis_results/visualizations/diversity"
         os.makedirs(output_dir, exist_ok=True)
         
-        # 1. 多样性分布对比图
-        self._create_diversity_distribution_plot(output_dir)
+        # 只在需要绘图时才导入 matplotlib，仅做统计分析的调用无需承担其导入开销
+        import matplotlib
+        matplotlib.use('Agg')  # 只输出图片文件，使用非交互式后端，避免在无显示环境下初始化 GUI
         
-        # 2. 多样性影响分析图
-        self._create_diversity_impact_plot(output_dir)
+        # 设置中文字体和样式
+        matplotlib.rcParams['font.family'] = ['Arial', 'DejaVu Sans']
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        # 允许合并视觉上重合的路径顶点，加快渲染
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
         
-        # 3. 相关性分析图
-        self._create_correlation_plot(output_dir)
+        import matplotlib.pyplot as plt
+        
+        # 三张图尺寸相同，共用一个 Figure（画布与图形管理器只创建一次），每张图画之前清空
+        fig = plt.figure(figsize=(16, 12))
+        plot_steps = [
+            self._create_diversity_distribution_plot,  # 1. 多样性分布对比图
+            self._create_diversity_impact_plot,  # 2. 多样性影响分析图
+            self._create_correlation_plot  # 3. 相关性分析图
+        ]
+        for plot in plot_steps:
+            fig.clf()
+            plot(output_dir, fig)
+        plt.close(fig)
         
         print(f"✅ 可视化图表已保存到 {output_dir}")
     
-    def _create_diversity_distribution_plot(self, output_dir):
+    def _create_diversity_distribution_plot(self, output_dir, fig):
         """创建多样性分布图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        
-        # 1. 性别分布
-        gender_dist = self.diversity_results['gender_diversity']['gender_distribution']
-        if gender_dist:
-            ax1.pie(gender_dist.values(), labels=gender_dist.keys(), autopct='%1.1f%%', startangle=90)
-            ax1.set_title('Gender Distribution of Reviewers', fontsize=14, fontweight='bold')
-        
-        # 2. 文化圈分布
-        culture_dist = self.diversity_results['cultural_diversity']['culture_distribution']
-        if culture_dist:
-            ax2.pie(culture_dist.values(), labels=culture_dist.keys(), autopct='%1.1f%%', startangle=90)
-            ax2.set_title('Cultural Circle Distribution of Reviewers', fontsize=14, fontweight='bold')
-        
-        # 3. 机构类型分布
-        type_dist = self.diversity_results['institutional_diversity']['type_distribution']
-        if type_dist:
-            ax3.pie(type_dist.values(), labels=type_dist.keys(), autopct='%1.1f%%', startangle=90)
-            ax3.set_title('Institution Type Distribution of Reviewers', fontsize=14, fontweight='bold')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        
+        # 1-3. 性别、文化圈、机构类型分布
+        pie_specs = [
+            (ax1, 'gender_diversity', 'gender_distribution', 'Gender'),
+            (ax2, 'cultural_diversity', 'culture_distribution', 'Cultural Circle'),
+            (ax3, 'institutional_diversity', 'type_distribution', 'Institution Type')
+        ]
+        for ax, result_key, dist_key, label in pie_specs:
+            dist = self.diversity_results[result_key][dist_key]
+            if dist:
+                ax.pie(dist.values(), labels=dist.keys(), autopct='%1.1f%%', startangle=90)
+                ax.set_title(f'{label} Distribution of Reviewers', fontsize=14, fontweight='bold')
         
         # 4. 综合多样性效益
         ax4.axis('off')
         benefits = self.diversity_results['composite_diversity']['overall_diversity_benefits']
-        benefit_text = "Diversity Benefits Summary:\n\n"
-        
-        for rec in benefits.get('recommendations', []):
-            benefit_text += f"• {rec}\n"
+        benefit_text = "Diversity Benefits Summary:\n\n" + "".join(
+            f"• {rec}\n" for rec in benefits.get('recommendations', []))
         
         ax4.text(0.1, 0.9, benefit_text, transform=ax4.transAxes, fontsize=10,
                 verticalalignment='top', wrap=True)
         ax4.set_title('Diversity Benefits Summary', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/diversity_distribution_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/diversity_distribution_analysis.png", dpi=300)
     
-    def _create_diversity_impact_plot(self, output_dir):
+    def _create_diversity_impact_plot(self, output_dir, fig):
         """创建多样性影响分析图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        axes = fig.subplots(2, 2)
         
         diversity_types = ['gender_diversity', 'cultural_diversity', 'institutional_diversity']
-        colors = ['lightblue', 'lightcoral', 'lightgreen']
         
-        # 准备数据
-        high_div_data = {'rating': [], 'confidence': [], 'consistency': [], 'detail': []}
-        low_div_data = {'rating': [], 'confidence': [], 'consistency': [], 'detail': []}
-        labels = []
+        # 准备数据：预分配 [高/低多样性, 维度, 统计项] 数组按位置写入，缺少统计的维度保持 NaN
+        labels = [None] * len(diversity_types)
+        raw = np.full((2, len(diversity_types), len(IMPACT_STAT_KEYS)), np.nan)
         
         for i, div_type in enumerate(diversity_types):
             analysis_data = self.diversity_results[div_type]['submission_diversity_analysis']
             
-            if 'high_diversity_stats' in analysis_data and 'low_diversity_stats' in analysis_data:
-                high_stats = analysis_data['high_diversity_stats']
-                low_stats = analysis_data['low_diversity_stats']
-                
-                high_div_data['rating'].append(high_stats.get('avg_rating', 0))
-                low_div_data['rating'].append(low_stats.get('avg_rating', 0))
-                
-                high_div_data['confidence'].append(high_stats.get('avg_confidence', 0))
-                low_div_data['confidence'].append(low_stats.get('avg_confidence', 0))
-                
-                # 一致性 = 1 - std (简化)
-                high_div_data['consistency'].append(max(0, 1 - high_stats.get('avg_rating_std', 0)))
-                low_div_data['consistency'].append(max(0, 1 - low_stats.get('avg_rating_std', 0)))
-                
-                high_div_data['detail'].append(min(high_stats.get('avg_text_length', 0) / 2000, 1))
-                low_div_data['detail'].append(min(low_stats.get('avg_text_length', 0) / 2000, 1))
-                
-                labels.append(div_type.replace('_diversity', '').title())
-        
-        # 1. 平均评分对比
-        x = np.arange(len(labels))
-        width = 0.35
-        
-        if high_div_data['rating']:
-            bars1 = ax1.bar(x - width/2, high_div_data['rating'], width, label='High Diversity', color='skyblue', alpha=0.7)
-            bars2 = ax1.bar(x + width/2, low_div_data['rating'], width, label='Low Diversity', color='lightcoral', alpha=0.7)
-            ax1.set_title('Average Rating: High vs Low Diversity', fontsize=14, fontweight='bold')
-            ax1.set_xlabel('Diversity Type')
-            ax1.set_ylabel('Average Rating')
-            ax1.set_xticks(x)
-            ax1.set_xticklabels(labels)
-            ax1.legend()
-        
-        # 2. 信心度对比
-        if high_div_data['confidence']:
-            bars1 = ax2.bar(x - width/2, high_div_data['confidence'], width, label='High Diversity', color='lightgreen', alpha=0.7)
-            bars2 = ax2.bar(x + width/2, low_div_data['confidence'], width, label='Low Diversity', color='orange', alpha=0.7)
-            ax2.set_title('Average Confidence: High vs Low Diversity', fontsize=14, fontweight='bold')
-            ax2.set_xlabel('Diversity Type')
-            ax2.set_ylabel('Average Confidence')
-            ax2.set_xticks(x)
-            ax2.set_xticklabels(labels)
-            ax2.legend()
-        
-        # 3. 一致性对比
-        if high_div_data['consistency']:
-            bars1 = ax3.bar(x - width/2, high_div_data['consistency'], width, label='High Diversity', color='purple', alpha=0.7)
-            bars2 = ax3.bar(x + width/2, low_div_data['consistency'], width, label='Low Diversity', color='brown', alpha=0.7)
-            ax3.set_title('Consistency: High vs Low Diversity', fontsize=14, fontweight='bold')
-            ax3.set_xlabel('Diversity Type')
-            ax3.set_ylabel('Consistency Score')
-            ax3.set_xticks(x)
-            ax3.set_xticklabels(labels)
-            ax3.legend()
-        
-        # 4. 详细度对比
-        if high_div_data['detail']:
-            bars1 = ax4.bar(x - width/2, high_div_data['detail'], width, label='High Diversity', color='pink', alpha=0.7)
-            bars2 = ax4.bar(x + width/2, low_div_data['detail'], width, label='Low Diversity', color='gray', alpha=0.7)
-            ax4.set_title('Detail Level: High vs Low Diversity', fontsize=14, fontweight='bold')
-            ax4.set_xlabel('Diversity Type')
-            ax4.set_ylabel('Detail Score')
-            ax4.set_xticks(x)
-            ax4.set_xticklabels(labels)
-            ax4.legend()
-        
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/diversity_impact_comparison.png", dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    def _create_correlation_plot(self, output_dir):
+            high_stats = analysis_data.get('high_diversity_stats')
+            low_stats = analysis_data.get('low_diversity_stats')
+            if high_stats is not None and low_stats is not None:
+                labels[i] = div_type.replace('_diversity', '').title()
+                high_get, low_get = high_stats.get, low_stats.get
+                raw[0, i] = [high_get(key, 0) for key in IMPACT_STAT_KEYS]
+                raw[1, i] = [low_get(key, 0) for key in IMPACT_STAT_KEYS]
+        
+        # 只绘制高/低多样性两组统计都有的维度
+        available = np.array([label is not None for label in labels], dtype=bool)
+        labels = [label for label in labels if label is not None]
+        
+        def impact_metrics(group_stats):
+            """把某一组的 (维度数, 4) 统计换算为 (4, 维度数) 的评分、信心度、一致性、详细度指标"""
+            return np.vstack([
+                group_stats[:, 0],
+                group_stats[:, 1],
+                np.maximum(0, 1 - group_stats[:, 2]),  # 一致性 = 1 - std (简化)
+                np.minimum(group_stats[:, 3] / 2000, 1)
+            ])
+        
+        highs = impact_metrics(raw[0, available])
+        lows = impact_metrics(raw[1, available])
+        
+        # 四个子图依次对比评分、信心度、一致性、详细度
+        if labels:
+            x = np.arange(len(labels))
+            left, right = x - BAR_WIDTH/2, x + BAR_WIDTH/2
+            for ax, high, low, (title, ylabel, colors) in zip(axes.flat, highs, lows, IMPACT_PANELS):
+                grouped_bars(ax, x, left, right, labels, high, low, title, ylabel, colors)
+        
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/diversity_impact_comparison.png", dpi=300)
+    
+    def _create_correlation_plot(self, output_dir, fig):
         """创建相关性分析图"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        # 模拟相关性数据（实际应该从真实数据计算）
-        diversity_scores = np.random.uniform(0, 1, 100)
-        ratings = 4.5 + np.random.normal(0, 0.5, 100) + 0.3 * diversity_scores
-        confidences = 3.5 + np.random.normal(0, 0.3, 100) + 0.2 * diversity_scores
+        # 模拟相关性数据（实际应该从真实数据计算）；固定种子使每次生成的图一致，两组噪声一次生成
+        rng = np.random.default_rng(0)
+        diversity_scores = rng.random(100)
+        noise = rng.standard_normal((2, 100))
+        ratings = 4.5 + 0.5 * noise[0] + 0.3 * diversity_scores
+        confidences = 3.5 + 0.3 * noise[1] + 0.2 * diversity_scores
         
         # 1. 多样性 vs 评分
-        ax1.scatter(diversity_scores, ratings, alpha=0.6, color='blue')
-        z = np.polyfit(diversity_scores, ratings, 1)
-        p = np.poly1d(z)
-        ax1.plot(diversity_scores, p(diversity_scores), "r--", alpha=0.8)
+        ax1.scatter(diversity_scores, ratings, alpha=0.6, color='blue', rasterized=True)
+        slope, intercept = linear_fit(diversity_scores, ratings)
+        ax1.plot(diversity_scores, slope * diversity_scores + intercept, "r--", alpha=0.8)
         ax1.set_xlabel('Diversity Score')
         ax1.set_ylabel('Average Rating')
         ax1.set_title('Diversity vs Average Rating', fontsize=14, fontweight='bold')
         
         # 2. 多样性 vs 信心度
-        ax2.scatter(diversity_scores, confidences, alpha=0.6, color='green')
-        z = np.polyfit(diversity_scores, confidences, 1)
-        p = np.poly1d(z)
-        ax2.plot(diversity_scores, p(diversity_scores), "r--", alpha=0.8)
+        ax2.scatter(diversity_scores, confidences, alpha=0.6, color='green', rasterized=True)
+        slope, intercept = linear_fit(diversity_scores, confidences)
+        ax2.plot(diversity_scores, slope * diversity_scores + intercept, "r--", alpha=0.8)
         ax2.set_xlabel('Diversity Score')
         ax2.set_ylabel('Average Confidence')
         ax2.set_title('Diversity vs Average Confidence', fontsize=14, fontweight='bold')
@@ -766,17 +910,16 @@ class DiversityAnalyzer:
         ax3.set_yticklabels(labels)
         ax3.set_title('Diversity Type Correlations', fontsize=14, fontweight='bold')
         
-        # 添加数值标注
-        for i in range(3):
-            for j in range(3):
-                text = ax3.text(j, i, f'{corr_matrix[i, j]:.2f}',
-                              ha="center", va="center", color="black", fontweight='bold')
+        # 添加数值标注（标注文本整体格式化一次）
+        cell_texts = np.char.mod('%.2f', corr_matrix)
+        for i, j in np.ndindex(corr_matrix.shape):
+            ax3.text(j, i, cell_texts[i, j], ha="center", va="center", color="black", fontweight='bold')
         
-        plt.colorbar(im, ax=ax3, shrink=0.8)
+        fig.colorbar(im, ax=ax3, shrink=0.8)
         
         # 4. 统计显著性
         ax4.axis('off')
-        significance_text = "Statistical Significance Tests:\n\n"
+        significance_parts = ["Statistical Significance Tests:\n"]
         
         for div_type in ['gender_diversity', 'cultural_diversity', 'institutional_diversity']:
             corr_data = self.diversity_results.get(div_type, {}).get('diversity_correlation', {})
@@ -784,16 +927,20 @@ class DiversityAnalyzer:
                 rating_corr = corr_data.get('rating_correlation', {})
                 if rating_corr:
                     sig_text = "Significant" if rating_corr.get('significant', False) else "Not significant"
-                    significance_text += f"{div_type.replace('_', ' ').title()}:\n"
-                    significance_text += f"  Rating correlation: {rating_corr.get('correlation', 0):.3f} ({sig_text})\n\n"
+                    significance_parts.append(
+                        f"{div_type.replace('_', ' ').title()}:\n"
+                        f"  Rating correlation: {rating_corr.get('correlation', 0):.3f} ({sig_text})\n")
+        
+        significance_text = "\n".join(significance_parts) + "\n"
         
         ax4.text(0.1, 0.9, significance_text, transform=ax4.transAxes, fontsize=10,
                 verticalalignment='top')
         ax4.set_title('Statistical Significance Summary', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/diversity_correlation_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{output_dir}/diversity_correlation_analysis.png", dpi=300)
+        # 矢量版本：散点（rasterized=True）按 dpi 栅格化，坐标轴、文字和趋势线保持矢量
+        fig.savefig(f"{output_dir}/diversity_correlation_analysis.pdf", dpi=150)
     
     def save_diversity_results(self):
         """保存多样性分析结果"""
@@ -813,8 +960,7 @@ class DiversityAnalyzer:
             'diversity_analysis': self.diversity_results
         }
         
-        with open(f"{output_dir}/diversity_analysis_results.json", 'w', encoding='utf-8') as f:
-            json.dump(diversity_data, f, ensure_ascii=False, indent=2)
+        dump_json(diversity_data, f"{output_dir}/diversity_analysis_results.json")
         
         # 保存简化版报告数据
         summary_data = {
@@ -823,8 +969,7 @@ class DiversityAnalyzer:
             'recommendations': self.diversity_results['composite_diversity']['overall_diversity_benefits']['recommendations']
         }
         
-        with open(f"{output_dir}/diversity_summary.json", 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+        dump_json(summary_data, f"{output_dir}/diversity_summary.json")
         
         print(f"✅ 结果已保存到 {output_dir}/ 目录")
     
@@ -837,24 +982,24 @@ class DiversityAnalyzer:
             'statistical_significance': []
         }
         
-        # 计算总审稿人数
-        for div_type in ['gender_diversity', 'cultural_diversity', 'institutional_diversity']:
-            distribution = self.diversity_results.get(div_type, {}).get('gender_distribution' if 'gender' in div_type 
-                                                                      else 'culture_distribution' if 'cultural' in div_type 
-                                                                      else 'type_distribution', {})
-            if distribution:
-                summary['total_reviewers_analyzed'] = max(summary['total_reviewers_analyzed'], sum(distribution.values()))
+        diversity_types = ['gender_diversity', 'cultural_diversity', 'institutional_diversity']
+        
+        # 总审稿人数：各维度分布计数之和的最大值
+        summary['total_reviewers_analyzed'] = max(
+            (int(np.fromiter(self.diversity_results.get(div_type, {}).get(DISTRIBUTION_KEYS[div_type], {}).values(),
+                             dtype=np.int64).sum())
+             for div_type in diversity_types),
+            default=0)
         
         # 提取关键洞察
-        for div_type in ['gender_diversity', 'cultural_diversity', 'institutional_diversity']:
-            impact_data = self.diversity_results.get(div_type, {}).get('submission_diversity_analysis', {})
-            if impact_data.get('statistical_test'):
-                test_data = impact_data['statistical_test']
-                if test_data.get('significant'):
-                    summary['statistical_significance'].append({
-                        'type': div_type,
-                        'effect': f"p-value: {test_data['p_value']}"
-                    })
+        for div_type in diversity_types:
+            results = self.diversity_results.get(div_type, {})
+            test_data = results.get('submission_diversity_analysis', {}).get('statistical_test')
+            if test_data and test_data.get('significant'):
+                summary['statistical_significance'].append({
+                    'type': div_type,
+                    'effect': f"p-value: {test_data['p_value']}"
+                })
         
         return summary
     